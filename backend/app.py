@@ -20,7 +20,6 @@ import time
 import zipfile
 import sys
 from datetime import datetime, timedelta
-from dataclasses import asdict
 from typing import Optional, Dict, Any
 from zoneinfo import ZoneInfo, available_timezones
 
@@ -41,6 +40,13 @@ _iers.conf.auto_download = False
 _iers.conf.auto_max_age = None          # suppress "IERS data is old" warnings
 _iers.conf.iers_degraded_accuracy = 'ignore'  # suppress "beyond IERS data range" warnings
 
+# Open the table eagerly so the first coordinate transform after startup
+# does not pay the one-time IERS parse cost mid-request.
+try:
+    _iers.IERS_Auto.open()
+except Exception:
+    pass  # first transform falls back to opening the table lazily
+
 from weather_openmeteo import get_hourly_forecast
 from events_aggregator import EventsAggregator
 from i18n_utils import I18nManager
@@ -3985,7 +3991,7 @@ def calculate_fov():
             seeing_arcsec=float(data.get('seeing_arcsec', 2.0))
         )
         
-        return jsonify(asdict(fov_calculation))
+        return jsonify(equipment_profiles.fov_to_dict(fov_calculation))
     except Exception as e:
         logger.error(f"Error calculating FOV: {e}")
         return jsonify({'error': 'Internal server error'}), 500
@@ -360,11 +360,9 @@ def update_solar_eclipse_cache(config=None):
         else:
             # Convert dataclass to dict
             eclipse_dict = eclipse.__dict__.copy()
-            # Convert altitude_vs_time EclipsePoint objects to dicts
+            # Expand the SoA altitude curve to plain JSON lists
             if "altitude_vs_time" in eclipse_dict:
-                eclipse_dict["altitude_vs_time"] = [
-                    point.__dict__ for point in eclipse_dict["altitude_vs_time"]
-                ]
+                eclipse_dict["altitude_vs_time"] = eclipse_dict["altitude_vs_time"].to_dict()
             
             response = {
                 "location": config["location"],
@@ -425,11 +423,9 @@ def update_lunar_eclipse_cache(config=None):
         else:
             # Convert dataclass to dict
             eclipse_dict = eclipse.__dict__.copy()
-            # Convert altitude_vs_time EclipsePoint objects to dicts
+            # Expand the SoA altitude curve to plain JSON lists
             if "altitude_vs_time" in eclipse_dict:
-                eclipse_dict["altitude_vs_time"] = [
-                    point.__dict__ for point in eclipse_dict["altitude_vs_time"]
-                ]
+                eclipse_dict["altitude_vs_time"] = eclipse_dict["altitude_vs_time"].to_dict()
             
             response = {
                 "location": config["location"],
@@ -487,18 +483,10 @@ def update_horizon_graph_cache(config=None):
                 "message": "Failed to calculate horizon data"
             }
         else:
-            # Convert dataclass to dict
-            horizon_dict = horizon_data.__dict__.copy()
-            # Convert HorizonPoint objects to dicts
-            if "sun_data" in horizon_dict:
-                horizon_dict["sun_data"] = [
-                    point.__dict__ for point in horizon_dict["sun_data"]
-                ]
-            if "moon_data" in horizon_dict:
-                horizon_dict["moon_data"] = [
-                    point.__dict__ for point in horizon_dict["moon_data"]
-                ]
-            
+            # Expand the array-backed horizon data to the response shape
+            horizon_dict = horizon_data.to_dict()
+
+
             response = {
                 "location": config["location"],
                 "horizon_data": horizon_dict,
@@ -2,19 +2,117 @@
 Equipment Profiles Module - Astrophotography Equipment Management
 Manages user equipment profiles: telescopes, cameras, mounts, filters, and combinations
 """
+import atexit
+import contextlib
+import copy
+import functools
+import hashlib
 import json
+import math
+import mmap
 import os
+import sys
+import threading
 import uuid
-import shutil
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from enum import Enum
 from logging_config import get_logger
 from constants import DATA_DIR
 
+# Windows-compatible file locking (same guard as cache_store)
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+# Optional orjson dependency — much faster parse/serialize than stdlib json
+try:
+    import orjson as _orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+    _HAS_ORJSON = False
+
+# Optional ijson dependency — streaming parse for single-item reads
+try:
+    import ijson as _ijson
+    _HAS_IJSON = True
+except ImportError:
+    _ijson = None  # type: ignore[assignment]
+    _HAS_IJSON = False
+
 logger = get_logger(__name__)
 
+
+def _json_loads(raw: bytes) -> Dict:
+    """Parse JSON bytes with orjson when available, stdlib json otherwise"""
+    if _HAS_ORJSON:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Below this size the mmap setup cost outweighs the saved copy
+_MMAP_THRESHOLD_BYTES = 4096
+
+
+def _read_json_file(file_path: str) -> Dict:
+    """Parse a JSON file from disk.
+
+    Larger files are mmap-ed so orjson parses straight out of the page
+    cache without an intermediate user-space copy; small files (and the
+    stdlib-json fallback, which cannot parse a buffer) use a plain read.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if _HAS_ORJSON and size >= _MMAP_THRESHOLD_BYTES:
+            mm = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+            try:
+                # memoryview keeps this zero-copy; orjson rejects a bare mmap
+                return _json_loads(memoryview(mm))
+            finally:
+                mm.close()
+        return _json_loads(os.read(fd, size))
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_json_cached(file_path: str, mtime_ns: int, size: int) -> Dict:
+    """Parse a JSON file, memoized on (path, mtime, size).
+
+    mtime_ns plus size in the key makes invalidation automatic: every
+    successful save rewrites the file via os.replace, which bumps the
+    mtime and retires the stale entry.
+    """
+    return _read_json_file(file_path)
+
+
+def _cached_json_load(file_path: str) -> Dict:
+    """Load a JSON file through the mtime-keyed parse cache.
+
+    Repeated reads of an unchanged file (e.g. analyze_combination hitting
+    the same user document for every kind) cost one os.stat plus a copy
+    instead of a full read + parse. The deep copy keeps the cached
+    document pristine: callers (including _mutate) edit their result in
+    place, and handing every thread the same dict would let readers see
+    half-applied mutations. Raises FileNotFoundError like a plain open.
+    """
+    stat = os.stat(file_path)
+    return copy.deepcopy(_parse_json_cached(file_path, stat.st_mtime_ns, stat.st_size))
+
+
+def _json_dumps(data: Dict) -> bytes:
+    """Serialize to JSON bytes (indented) with orjson when available"""
+    if _HAS_ORJSON:
+        return _orjson.dumps(
+            data,
+            option=_orjson.OPT_INDENT_2 | _orjson.OPT_SERIALIZE_DATACLASS | _orjson.OPT_NAIVE_UTC,
+        )
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
 # Equipment data directory
 EQUIPMENT_DIR = os.path.join(DATA_DIR, 'equipments')
 
@@ -82,7 +180,7 @@ class ImagingType(str, Enum):
 # Data Models
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Telescope:
     """Telescope profile"""
     id: str
@@ -108,7 +206,7 @@ class Telescope:
             self.effective_focal_ratio = round(self.effective_focal_length / self.aperture_mm, 2)
 
 
-@dataclass
+@dataclass(slots=True)
 class Camera:
     """Camera profile"""
     id: str
@@ -132,13 +230,12 @@ class Camera:
 
     def __post_init__(self):
         """Calculate derived values"""
-        import math
         self.sensor_diagonal_mm = round(
             math.sqrt(self.sensor_width_mm**2 + self.sensor_height_mm**2), 2
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Mount:
     """Mount profile"""
     id: str
@@ -160,7 +257,7 @@ class Mount:
             self.recommended_payload_kg = round(self.payload_capacity_kg * 0.75, 2)
 
 
-@dataclass
+@dataclass(slots=True)
 class Filter:
     """Filter profile"""
     id: str
@@ -176,7 +273,7 @@ class Filter:
     updated_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Accessory:
     """Accessory profile (field flattener, focuser, etc.)"""
     id: str
@@ -250,14 +347,42 @@ class CombinationAnalysis:
 # Directory & File Management
 # ============================================================
 
+# All equipment kinds stored in the combined per-user file
+EQUIPMENT_KINDS = ('telescopes', 'cameras', 'mounts', 'filters', 'accessories', 'combinations')
+
+
+# Directory already ensured this process (tracks the path so a changed
+# EQUIPMENT_DIR, e.g. in tests, re-triggers the makedirs)
+_ensured_dir: Optional[str] = None
+
+
 def ensure_equipment_directories():
-    """Ensure equipment directories exist"""
+    """Ensure equipment directories exist (one makedirs per process)"""
+    global _ensured_dir
+    if _ensured_dir == EQUIPMENT_DIR:
+        return
     os.makedirs(EQUIPMENT_DIR, exist_ok=True)
+    _ensured_dir = EQUIPMENT_DIR
+
+
+@functools.lru_cache(maxsize=4096)
+def _user_equipment_path(equipment_dir: str, user_id: str) -> str:
+    """Join the per-user path once per (dir, user) — hot on every CRUD call"""
+    return os.path.join(equipment_dir, f'{user_id}.json')
 
 
-def get_user_equipment_file(user_id: str, equipment_type: str) -> str:
-    """Get the path to a user's equipment file"""
+def get_user_equipment_file(user_id: str, equipment_type: str = '') -> str:
+    """Get the path to a user's combined equipment file.
+
+    All equipment kinds live in one {user_id}.json since the combined-file
+    migration; the equipment_type argument is retained for compatibility.
+    """
     ensure_equipment_directories()
+    return _user_equipment_path(EQUIPMENT_DIR, user_id)
+
+
+def _legacy_equipment_file(user_id: str, equipment_type: str) -> str:
+    """Path of the pre-migration per-kind equipment file"""
     return os.path.join(EQUIPMENT_DIR, f'{user_id}_{equipment_type}.json')
 
 
@@ -272,725 +397,789 @@ def validate_equipment_json(file_path: str) -> Tuple[bool, str]:
         Tuple of (is_valid, error_message)
     """
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        # Basic structure validation
+        # Fast-fail on the common corruption shapes (empty file,
+        # truncated write) from a few bytes before paying for a full parse
+        size = os.stat(file_path).st_size
+        if size == 0:
+            return False, "File is empty"
+
+        with open(file_path, 'rb') as f:
+            head = f.read(8)
+            if not head.lstrip().startswith(b'{'):
+                return False, "Missing opening brace"
+            # Scan backwards past trailing whitespace for the last
+            # content byte — hand-edited files can end in blank lines
+            pos = size
+            last_byte = b''
+            while pos > 0 and not last_byte:
+                chunk_len = min(64, pos)
+                pos -= chunk_len
+                f.seek(pos)
+                last_byte = f.read(chunk_len).rstrip()[-1:]
+            if last_byte != b'}':
+                return False, "Missing closing brace"
+            f.seek(0)
+            data = _json_loads(f.read())
+
+        # Basic structure validation — accepts both the combined per-user
+        # schema (one sub-document per kind) and a legacy per-kind file
         if not isinstance(data, dict):
             return False, "JSON root must be an object"
-        
-        if 'items' not in data or not isinstance(data['items'], list):
-            return False, "Missing or invalid 'items' array"
-        
+
+        if isinstance(data.get('items'), list):
+            return True, ""
+
+        for kind in EQUIPMENT_KINDS:
+            sub = data.get(kind)
+            if not isinstance(sub, dict) or not isinstance(sub.get('items'), list):
+                return False, f"Missing or invalid '{kind}.items' array"
+
         return True, ""
     
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # json.JSONDecodeError and orjson.JSONDecodeError both subclass ValueError
         return False, f"Invalid JSON: {e}"
     except Exception as e:
         return False, f"Validation error: {e}"
 
 
-def safe_save_equipment(file_path: str, data: Dict) -> bool:
+def _validate_in_memory(data: Dict) -> Tuple[bool, str]:
+    """
+    Validate the in-memory equipment structure before it is serialized
+
+    Args:
+        data: Equipment data about to be saved (combined blob or a
+            legacy single-kind document)
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if not isinstance(data, dict):
+        return False, "Equipment data must be a dict"
+    if isinstance(data.get('items'), list):
+        return True, ""
+    for kind in EQUIPMENT_KINDS:
+        sub = data.get(kind)
+        if not isinstance(sub, dict) or not isinstance(sub.get('items'), list):
+            return False, f"Missing or invalid '{kind}.items' array"
+    return True, ""
+
+
+# ============================================================
+# Write-Behind Coalescing (opt-in)
+# ============================================================
+
+# When enabled, bursty mutations to the same file (e.g. a user editing
+# many profiles in sequence) collapse into a single disk write: each save
+# marks the file dirty and (re)arms a short debounce timer; only the
+# last payload within the window hits the disk. Loads consult the dirty
+# map first so read-your-writes semantics hold. Disabled by default —
+# single mutations then remain write-through and durable.
+WRITE_BEHIND_ENABLED = os.environ.get('EQUIPMENT_WRITE_BEHIND', '').lower() in ('1', 'true', 'yes')
+WRITE_BEHIND_DELAY_SECONDS = 0.1
+
+_dirty: Dict[str, Dict] = {}
+_flush_timers: Dict[str, threading.Timer] = {}
+_write_behind_lock = threading.Lock()
+
+
+def _enqueue_save(file_path: str, data: Dict) -> bool:
+    """Mark a file dirty and (re)arm its debounced flush timer"""
+    with _write_behind_lock:
+        _dirty[file_path] = data
+        timer = _flush_timers.get(file_path)
+        if timer is not None:
+            timer.cancel()
+        timer = threading.Timer(WRITE_BEHIND_DELAY_SECONDS, _flush_one, args=(file_path,))
+        timer.daemon = True
+        _flush_timers[file_path] = timer
+        timer.start()
+    return True
+
+
+def _flush_one(file_path: str) -> None:
+    """Write the pending payload for one file, if any"""
+    with _write_behind_lock:
+        data = _dirty.pop(file_path, None)
+        timer = _flush_timers.pop(file_path, None)
+        if timer is not None:
+            timer.cancel()
+    if data is not None:
+        _write_equipment_file(file_path, data)
+
+
+def _flush_all() -> None:
+    """Flush every pending write — registered to run at interpreter exit"""
+    for file_path in list(_dirty.keys()):
+        _flush_one(file_path)
+
+
+atexit.register(_flush_all)
+
+
+def safe_save_equipment(file_path: str, data: Dict, synchronous: Optional[bool] = None) -> bool:
     """
     Safely save equipment data with backup and validation
-    
+
     Args:
         file_path: Path to equipment file
         data: Equipment data to save
-    
+        synchronous: Force write-through (True) or write-behind (False);
+            defaults to write-through unless EQUIPMENT_WRITE_BEHIND is set
+
     Returns:
-        True if save successful, False otherwise
+        True if save successful (or successfully queued), False otherwise
     """
+    # Validate the in-memory structure before touching disk. The
+    # serialized bytes are guaranteed valid JSON if the dump succeeds,
+    # so no read-back re-parse is needed afterwards.
+    is_valid, error_msg = _validate_in_memory(data)
+    if not is_valid:
+        logger.error(f"Validation failed for {file_path}: {error_msg}")
+        return False
+
+    if synchronous is None:
+        synchronous = not WRITE_BEHIND_ENABLED
+    if not synchronous:
+        return _enqueue_save(file_path, data)
+    return _write_equipment_file(file_path, data)
+
+
+# sha256 of the content this process last wrote per file, validated by
+# the (mtime_ns, size) stat of that write — lets no-op saves (e.g. an
+# update with identical fields) skip the backup/write/fsync cycle. The
+# stat check ties the skip to what is actually on disk: another worker's
+# write bumps the mtime and invalidates the entry, so a remembered sha
+# can never suppress a write over someone else's data.
+_disk_sha: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def _content_sha(data: Dict) -> bytes:
+    """Content hash with the volatile updated_at stamps excluded.
+
+    updated_at is refreshed on every save, so hashing the raw bytes
+    would never detect a no-op; strip the container-level stamps before
+    hashing (per-item timestamps still count as content).
+    """
+    stripped = {k: v for k, v in data.items() if k != 'updated_at'}
+    for kind in EQUIPMENT_KINDS:
+        sub = stripped.get(kind)
+        if isinstance(sub, dict) and 'updated_at' in sub:
+            stripped[kind] = {k: v for k, v in sub.items() if k != 'updated_at'}
+    return hashlib.sha256(_json_dumps(stripped)).digest()
+
+
+def _write_equipment_file(file_path: str, data: Dict) -> bool:
+    """Atomically write validated equipment data to disk"""
     backup_path = file_path + '.backup'
-    temp_path = file_path + '.tmp'
-    
+    # Unique temp name so concurrent writers never collide on O_EXCL
+    temp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+
     try:
-        # Step 1: Backup existing file if it exists
+        new_sha = _content_sha(data)
+        cached = _disk_sha.get(file_path)
+        if cached is not None and cached[1] == new_sha:
+            try:
+                stat = os.stat(file_path)
+                if (stat.st_mtime_ns, stat.st_size) == cached[0]:
+                    logger.debug(f"Skipping unchanged save: {file_path}")
+                    return True
+            except FileNotFoundError:
+                pass
+
+        # Step 1: Backup existing file via hardlink (O(1), no bytes copied)
         if os.path.exists(file_path):
-            shutil.copy2(file_path, backup_path)
+            if os.path.exists(backup_path):
+                os.remove(backup_path)
+            os.link(file_path, backup_path)
             logger.debug(f"Created backup: {backup_path}")
-        
-        # Step 2: Write to temporary file
-        with open(temp_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+
+        # Step 2: Write to temporary file and flush to stable storage.
+        # O_EXCL guarantees a fresh file — a plain open('w') would
+        # silently truncate a temp another process is mid-writing.
+        fd = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_json_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
         logger.debug(f"Wrote temporary file: {temp_path}")
-        
-        # Step 3: Validate temporary file
-        is_valid, error_msg = validate_equipment_json(temp_path)
-        if not is_valid:
-            logger.error(f"Validation failed for {temp_path}: {error_msg}")
-            # Restore from backup
-            if os.path.exists(backup_path):
-                shutil.copy2(backup_path, file_path)
-                logger.info(f"Restored from backup: {backup_path}")
-            os.remove(temp_path)
-            return False
-        
-        # Step 4: Move temporary file to final location
-        shutil.move(temp_path, file_path)
-        logger.debug(f"Moved {temp_path} to {file_path}")
-        
-        # Step 5: Delete backup on success
+
+        # Step 3: Atomically rename temporary file into place (single
+        # rename(2) syscall — the previous contents stay intact on failure)
+        os.replace(temp_path, file_path)
+        logger.debug(f"Replaced {file_path} with {temp_path}")
+
+        # Fsync the directory so the rename itself survives power loss.
+        # Windows has no O_DIRECTORY / directory fsync; NTFS journals the
+        # rename itself, so skip it there.
+        if sys.platform != "win32":
+            dir_fd = os.open(os.path.dirname(file_path) or '.', os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+        stat = os.stat(file_path)
+        _disk_sha[file_path] = ((stat.st_mtime_ns, stat.st_size), new_sha)
+
+        # Step 4: Delete backup on success
         if os.path.exists(backup_path):
             os.remove(backup_path)
             logger.debug(f"Deleted backup: {backup_path}")
-        
+
         return True
-    
+
     except Exception as e:
         logger.error(f"Error during safe save: {e}")
-        # Attempt to restore from backup
-        if os.path.exists(backup_path) and os.path.exists(file_path):
-            try:
-                shutil.copy2(backup_path, file_path)
-                logger.info(f"Restored from backup after error: {backup_path}")
-            except Exception as restore_error:
-                logger.error(f"Failed to restore from backup: {restore_error}")
-        
-        # Clean up temporary file
+        # os.replace is atomic, so the previous file contents are still in
+        # place on failure — only the temporary file needs cleaning up
         if os.path.exists(temp_path):
             try:
                 os.remove(temp_path)
-            except:
+            except OSError:
                 pass
-        
-        return False
-
 
-# ============================================================
-# CRUD Operations - Telescopes
-# ============================================================
+        return False
 
-def load_user_telescopes(user_id: str) -> Dict:
-    """Load user's telescope profiles"""
-    file_path = get_user_equipment_file(user_id, 'telescopes')
-    
-    if not os.path.exists(file_path):
-        return {
-            'user_id': user_id,
-            'created_at': datetime.now().isoformat(),
-            'items': []
-        }
-    
-    try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Error loading telescopes for {user_id}: {e}")
-        return {
-            'user_id': user_id,
-            'created_at': datetime.now().isoformat(),
-            'items': []
-        }
 
+def _to_dict(obj, field_names: Tuple[str, ...]) -> Dict:
+    """Flat dataclass -> dict without asdict()'s recursive deepcopy walk.
 
-def save_user_telescopes(user_id: str, data: Dict) -> bool:
-    """Save user's telescope profiles with safety checks"""
-    file_path = get_user_equipment_file(user_id, 'telescopes')
-    data['updated_at'] = datetime.now().isoformat()
-    return safe_save_equipment(file_path, data)
+    asdict() reflects over the dataclass and deep-copies every value —
+    needlessly expensive for these flat profile records whose field
+    tuples are known once at import.
+    """
+    return {name: getattr(obj, name) for name in field_names}
 
 
-def create_telescope(user_id: str, telescope_data: Dict) -> Optional[Dict]:
-    """Create a new telescope profile"""
-    try:
-        # Helper to convert empty strings to None for optional float fields
-        def get_float_or_none(value, default=None):
-            if not value or value == '':
-                return default
-            return float(value)
-        
-        # Create telescope object with auto-calculated fields
-        telescope = Telescope(
-            id=str(uuid.uuid4()),
-            name=telescope_data['name'],
-            manufacturer=telescope_data.get('manufacturer', ''),
-            telescope_type=telescope_data['telescope_type'],
-            aperture_mm=float(telescope_data['aperture_mm']),
-            focal_length_mm=float(telescope_data['focal_length_mm']),
-            weight_kg=get_float_or_none(telescope_data.get('weight_kg'), 0.0),
-            reducer_barlow_factor=get_float_or_none(telescope_data.get('reducer_barlow_factor'), 1.0),
-            native_focal_ratio=0.0,  # Will be calculated
-            effective_focal_length=0.0,  # Will be calculated
-            effective_focal_ratio=0.0,  # Will be calculated
-            notes=telescope_data.get('notes', ''),
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
-        )
-        
-        # Load existing data
-        data = load_user_telescopes(user_id)
-        
-        # Add new telescope
-        data['items'].append(asdict(telescope))
-        
-        # Save
-        if save_user_telescopes(user_id, data):
-            return asdict(telescope)
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error creating telescope: {e}")
-        return None
+_FOV_FIELD_NAMES = tuple(f.name for f in fields(FOVCalculation))
 
 
-def get_telescope(user_id: str, telescope_id: str) -> Optional[Dict]:
-    """Get a specific telescope profile"""
-    data = load_user_telescopes(user_id)
-    for item in data['items']:
-        if item['id'] == telescope_id:
-            return item
-    return None
+def fov_to_dict(fov: FOVCalculation) -> Dict:
+    """Serialize a FOVCalculation for API responses without asdict()"""
+    return _to_dict(fov, _FOV_FIELD_NAMES)
 
 
-def update_telescope(user_id: str, telescope_id: str, telescope_data: Dict) -> Optional[Dict]:
-    """Update a telescope profile"""
-    try:
-        # Helper to convert empty strings to None for optional float fields
-        def get_float_or_none(value, default=None):
-            if not value or value == '':
-                return default
-            return float(value)
-        
-        data = load_user_telescopes(user_id)
-        
-        for i, item in enumerate(data['items']):
-            if item['id'] == telescope_id:
-                # Update with recalculation
-                telescope = Telescope(
-                    id=telescope_id,
-                    name=telescope_data['name'],
-                    manufacturer=telescope_data.get('manufacturer', item.get('manufacturer', '')),
-                    telescope_type=telescope_data['telescope_type'],
-                    aperture_mm=float(telescope_data['aperture_mm']),
-                    focal_length_mm=float(telescope_data['focal_length_mm']),
-                    weight_kg=get_float_or_none(telescope_data.get('weight_kg'), item.get('weight_kg', 0.0)),
-                    reducer_barlow_factor=get_float_or_none(telescope_data.get('reducer_barlow_factor'), 1.0),
-                    native_focal_ratio=0.0,
-                    effective_focal_length=0.0,
-                    effective_focal_ratio=0.0,
-                    notes=telescope_data.get('notes', ''),
-                    created_at=item.get('created_at', datetime.now().isoformat()),
-                    updated_at=datetime.now().isoformat()
-                )
-                
-                data['items'][i] = asdict(telescope)
-                
-                if save_user_telescopes(user_id, data):
-                    return asdict(telescope)
-                return None
-        
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error updating telescope: {e}")
-        return None
-
+def _build_id_index(items: List[Dict]) -> Dict[str, int]:
+    """Build an id -> list position index for O(1) item lookup.
 
-def delete_telescope(user_id: str, telescope_id: str) -> bool:
-    """Delete a telescope profile and its associated plan if it exists."""
-    try:
-        data = load_user_telescopes(user_id)
-        data['items'] = [item for item in data['items'] if item['id'] != telescope_id]
-        result = save_user_telescopes(user_id, data)
-        if result:
-            # Cascade: remove the per-telescope plan file if present
-            try:
-                from plan_my_night import delete_plan_for_telescope
-                delete_plan_for_telescope(user_id, telescope_id)
-            except Exception as plan_error:
-                logger.warning(f'Could not delete plan for telescope {telescope_id}: {plan_error}')
-        return result
-    except Exception as e:
-        logger.error(f"Error deleting telescope: {e}")
-        return False
+    Rebuilt from the items list on every load — never persisted to disk.
+    """
+    return {item['id']: i for i, item in enumerate(items)}
 
 
 # ============================================================
-# CRUD Operations - Cameras
+# Combined Per-User Blob
 # ============================================================
 
-def load_user_cameras(user_id: str) -> Dict:
-    """Load user's camera profiles"""
-    file_path = get_user_equipment_file(user_id, 'cameras')
-    
-    if not os.path.exists(file_path):
-        return {
-            'user_id': user_id,
-            'created_at': datetime.now().isoformat(),
-            'items': []
-        }
-    
-    try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Error loading cameras for {user_id}: {e}")
-        return {
-            'user_id': user_id,
-            'created_at': datetime.now().isoformat(),
-            'items': []
-        }
+def _empty_blob(user_id: str) -> Dict:
+    """Fresh combined equipment document with one sub-document per kind"""
+    now_iso = datetime.now().isoformat()
+    blob: Dict = {
+        'user_id': user_id,
+        'created_at': now_iso,
+        'updated_at': now_iso,
+    }
+    for kind in EQUIPMENT_KINDS:
+        blob[kind] = {'created_at': now_iso, 'items': []}
+    return blob
 
 
-def save_user_cameras(user_id: str, data: Dict) -> bool:
-    """Save user's camera profiles with safety checks"""
-    file_path = get_user_equipment_file(user_id, 'cameras')
-    data['updated_at'] = datetime.now().isoformat()
-    return safe_save_equipment(file_path, data)
+def _load_user_blob(user_id: str) -> Dict:
+    """Load a user's combined equipment document.
+
+    One open + one parse serves every equipment kind. Falls back to the
+    legacy per-kind files (migrating them on the fly) when the combined
+    file does not exist yet.
+    """
+    file_path = get_user_equipment_file(user_id)
 
+    # Read-your-writes: a pending write-behind payload is newer than disk.
+    # Copied for the same reason as the parse cache — the queued payload
+    # is serialized by the flush thread and must not be mutated under it.
+    pending = _dirty.get(file_path)
+    if pending is not None:
+        return copy.deepcopy(pending)
 
-def create_camera(user_id: str, camera_data: Dict) -> Optional[Dict]:
-    """Create a new camera profile"""
     try:
-        # Helper to convert empty strings to None for optional float fields
-        def get_float_or_none(value, default=None):
-            if not value or value == '':
-                return default
-            return float(value)
-        
-        camera = Camera(
-            id=str(uuid.uuid4()),
-            name=camera_data['name'],
-            manufacturer=camera_data['manufacturer'],
-            sensor_width_mm=float(camera_data['sensor_width_mm']),
-            sensor_height_mm=float(camera_data['sensor_height_mm']),
-            resolution_width_px=int(camera_data['resolution_width_px']),
-            resolution_height_px=int(camera_data['resolution_height_px']),
-            pixel_size_um=float(camera_data['pixel_size_um']),
-            sensor_type=camera_data['sensor_type'],
-            weight_kg=get_float_or_none(camera_data.get('weight_kg'), 0.0),
-            sensor_diagonal_mm=0.0,  # Will be calculated
-            cooling_supported=camera_data.get('cooling_supported', False),
-            min_temperature_c=get_float_or_none(camera_data.get('min_temperature_c')),
-            read_noise_e=get_float_or_none(camera_data.get('read_noise_e')),
-            quantum_efficiency=get_float_or_none(camera_data.get('quantum_efficiency')),
-            notes=camera_data.get('notes', ''),
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
-        )
-        
-        data = load_user_cameras(user_id)
-        data['items'].append(asdict(camera))
-        
-        if save_user_cameras(user_id, data):
-            return asdict(camera)
-        return None
-        
+        blob = _cached_json_load(file_path)
+    except FileNotFoundError:
+        # Single stat via the failed open instead of a separate exists()
+        blob = _migrate_legacy_files(user_id)
+        return blob if blob is not None else _empty_blob(user_id)
     except Exception as e:
-        logger.error(f"Error creating camera: {e}")
-        return None
+        logger.error(f"Error loading equipment for {user_id}: {e}")
+        return _empty_blob(user_id)
 
+    # Tolerate partial blobs (e.g. written before a kind existed)
+    for kind in EQUIPMENT_KINDS:
+        if not isinstance(blob.get(kind), dict):
+            blob[kind] = {'items': []}
+    return blob
 
-def get_camera(user_id: str, camera_id: str) -> Optional[Dict]:
-    """Get a specific camera profile"""
-    data = load_user_cameras(user_id)
-    for item in data['items']:
-        if item['id'] == camera_id:
-            return item
-    return None
 
+def _save_user_blob(user_id: str, blob: Dict, now_iso: Optional[str] = None) -> bool:
+    """Persist a user's combined equipment document"""
+    blob['updated_at'] = now_iso if now_iso is not None else datetime.now().isoformat()
+    return safe_save_equipment(get_user_equipment_file(user_id), blob)
 
-def update_camera(user_id: str, camera_id: str, camera_data: Dict) -> Optional[Dict]:
-    """Update a camera profile"""
-    try:
-        # Helper to convert empty strings to None for optional float fields
-        def get_float_or_none(value, default=None):
-            if not value or value == '':
-                return default
-            return float(value)
-        
-        data = load_user_cameras(user_id)
-        
-        for i, item in enumerate(data['items']):
-            if item['id'] == camera_id:
-                camera = Camera(
-                    id=camera_id,
-                    name=camera_data['name'],
-                    manufacturer=camera_data['manufacturer'],
-                    sensor_width_mm=float(camera_data['sensor_width_mm']),
-                    sensor_height_mm=float(camera_data['sensor_height_mm']),
-                    resolution_width_px=int(camera_data['resolution_width_px']),
-                    resolution_height_px=int(camera_data['resolution_height_px']),
-                    pixel_size_um=float(camera_data['pixel_size_um']),
-                    sensor_type=camera_data['sensor_type'],
-                    weight_kg=get_float_or_none(camera_data.get('weight_kg'), item.get('weight_kg', 0.0)),
-                    sensor_diagonal_mm=0.0,
-                    cooling_supported=camera_data.get('cooling_supported', False),
-                    min_temperature_c=get_float_or_none(camera_data.get('min_temperature_c')),
-                    read_noise_e=get_float_or_none(camera_data.get('read_noise_e')),
-                    quantum_efficiency=get_float_or_none(camera_data.get('quantum_efficiency')),
-                    notes=camera_data.get('notes', ''),
-                    created_at=item.get('created_at', datetime.now().isoformat()),
-                    updated_at=datetime.now().isoformat()
-                )
-                
-                data['items'][i] = asdict(camera)
-                
-                if save_user_cameras(user_id, data):
-                    return asdict(camera)
-                return None
-        
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error updating camera: {e}")
+
+def _migrate_legacy_files(user_id: str) -> Optional[Dict]:
+    """One-shot merge of the legacy per-kind files into {user_id}.json.
+
+    Successfully merged legacy files are renamed to .legacy so the
+    migration never runs twice. Returns the merged blob, or None when no
+    legacy files exist.
+    """
+    legacy_paths = {}
+    for kind in EQUIPMENT_KINDS:
+        path = _legacy_equipment_file(user_id, kind)
+        if os.path.exists(path):
+            legacy_paths[kind] = path
+    if not legacy_paths:
         return None
 
+    blob = _empty_blob(user_id)
+    for kind, path in legacy_paths.items():
+        try:
+            with open(path, 'rb') as f:
+                legacy = _json_loads(f.read())
+            if isinstance(legacy, dict) and isinstance(legacy.get('items'), list):
+                blob[kind] = legacy
+        except Exception as e:
+            logger.error(f"Error migrating legacy {kind} for {user_id}: {e}")
+
+    if _save_user_blob(user_id, blob):
+        for kind, path in legacy_paths.items():
+            try:
+                os.replace(path, path + '.legacy')
+            except OSError as e:
+                logger.warning(f"Could not archive legacy {kind} file for {user_id}: {e}")
+        logger.info(f"Migrated {len(legacy_paths)} legacy equipment file(s) for {user_id}")
+        return blob
+    return None
+
 
-def delete_camera(user_id: str, camera_id: str) -> bool:
-    """Delete a camera profile"""
+@contextlib.contextmanager
+def _blob_write_lock(file_path: str):
+    """Exclusive advisory lock spanning a read-modify-write cycle.
+
+    Locks a sidecar .lock file rather than the data file itself — the
+    atomic-rename save replaces the data file's inode on every write,
+    which would silently detach a lock taken on it. Serializes mutations
+    across threads and processes on the same host.
+    """
+    fd = os.open(file_path + '.lock', os.O_CREAT | os.O_RDWR, 0o644)
     try:
-        data = load_user_cameras(user_id)
-        data['items'] = [item for item in data['items'] if item['id'] != camera_id]
-        return save_user_cameras(user_id, data)
-    except Exception as e:
-        logger.error(f"Error deleting camera: {e}")
-        return False
+        if sys.platform == "win32":
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        try:
+            if sys.platform == "win32":
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
 
 
 # ============================================================
-# CRUD Operations - Mounts
+# Generic Equipment Store
 # ============================================================
 
-def load_user_mounts(user_id: str) -> Dict:
-    """Load user's mount profiles"""
-    file_path = get_user_equipment_file(user_id, 'mounts')
-    
-    if not os.path.exists(file_path):
-        return {
-            'user_id': user_id,
-            'created_at': datetime.now().isoformat(),
-            'items': []
-        }
-    
-    try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Error loading mounts for {user_id}: {e}")
-        return {
-            'user_id': user_id,
-            'created_at': datetime.now().isoformat(),
-            'items': []
-        }
+class EquipmentStore:
+    """Generic CRUD engine shared by all equipment kinds.
 
+    The five equipment families (plus combinations) used to have
+    copy-pasted load/save/create/get/update/delete functions. This class
+    centralizes that hot path, parameterized by the equipment kind, its
+    dataclass, a builder that maps a request payload onto the dataclass,
+    and an optional payload validator.
+    """
 
-def save_user_mounts(user_id: str, data: Dict) -> bool:
-    """Save user's mount profiles with safety checks"""
-    file_path = get_user_equipment_file(user_id, 'mounts')
-    data['updated_at'] = datetime.now().isoformat()
-    return safe_save_equipment(file_path, data)
+    def __init__(self, kind: str, singular: str, cls: type, builder, validator=None):
+        self.kind = kind
+        self.singular = singular
+        self.cls = cls
+        self.builder = builder
+        self.validator = validator
+        # Field names resolved once so serialization can skip reflection
+        self.field_names = tuple(f.name for f in fields(cls))
+
+    def load(self, user_id: str) -> Dict:
+        """Load the user's profiles for this equipment kind"""
+        data = _load_user_blob(user_id)[self.kind]
+        if not isinstance(data.get('items'), list):
+            data['items'] = []
+        return data
+
+    def save(self, user_id: str, data: Dict, now_iso: Optional[str] = None) -> bool:
+        """Save the user's profiles for this equipment kind with safety checks"""
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+        data['updated_at'] = now_iso
+        blob = _load_user_blob(user_id)
+        blob[self.kind] = data
+        return _save_user_blob(user_id, blob, now_iso)
+
+    def get(self, user_id: str, item_id: str) -> Optional[Dict]:
+        """Get a single profile by id"""
+        file_path = get_user_equipment_file(user_id)
+
+        # Stream-parse and short-circuit on the matching id when ijson is
+        # available — avoids materializing the whole document for a
+        # single-item read. Skipped when a write-behind payload is
+        # pending (disk would be stale) or the file needs migration.
+        if _HAS_IJSON and file_path not in _dirty and os.path.exists(file_path):
+            try:
+                with open(file_path, 'rb') as f:
+                    for item in _ijson.items(f, f'{self.kind}.items.item', use_float=True):
+                        if item.get('id') == item_id:
+                            return item
+                return None
+            except Exception as e:
+                logger.debug(f"Streaming get for {self.kind} failed, falling back: {e}")
+
+        data = self.load(user_id)
+        idx = _build_id_index(data['items']).get(item_id)
+        return data['items'][idx] if idx is not None else None
+
+    def _build(self, payload: Dict, item: Dict, item_id: str, now_iso: str):
+        """Construct the dataclass for a create ({} item) or update"""
+        obj = self.builder(payload, item, item_id)
+        obj.created_at = item.get('created_at', now_iso)
+        obj.updated_at = now_iso
+        return obj
+
+    def _mutate(self, user_id: str, mutator):
+        """Locked read-modify-write cycle over this kind's sub-document.
+
+        One blob load serves both the mutation and the save — going
+        through load()/save() would parse the document twice per
+        mutation — and the exclusive lock spans the whole cycle so
+        concurrent writers cannot interleave between read and write.
+
+        The mutator receives (data, now_iso) and returns the value to
+        propagate; None aborts without saving. Returns that value on a
+        successful save, None otherwise.
+        """
+        with _blob_write_lock(get_user_equipment_file(user_id)):
+            blob = _load_user_blob(user_id)
+            data = blob[self.kind]
+            if not isinstance(data.get('items'), list):
+                data['items'] = []
+
+            # One timestamp per CRUD call — reused for created_at,
+            # updated_at and the container's updated_at
+            now_iso = datetime.now().isoformat()
+            result = mutator(data, now_iso)
+            if result is None:
+                return None
 
+            data['updated_at'] = now_iso
+            blob[self.kind] = data
+            if _save_user_blob(user_id, blob, now_iso):
+                return result
+            return None
 
-def create_mount(user_id: str, mount_data: Dict) -> Optional[Dict]:
-    """Create a new mount profile"""
-    try:
-        mount = Mount(
-            id=str(uuid.uuid4()),
-            name=mount_data['name'],
-            manufacturer=mount_data.get('manufacturer', ''),
-            mount_type=mount_data['mount_type'],
-            payload_capacity_kg=float(mount_data['payload_capacity_kg']),
-            recommended_payload_kg=0.0,  # Will be calculated
-            tracking_accuracy_arcsec=float(mount_data['tracking_accuracy_arcsec']) if mount_data.get('tracking_accuracy_arcsec') else None,
-            guiding_supported=mount_data.get('guiding_supported', False),
-            notes=mount_data.get('notes', ''),
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
-        )
-        
-        data = load_user_mounts(user_id)
-        data['items'].append(asdict(mount))
-        
-        if save_user_mounts(user_id, data):
-            return asdict(mount)
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error creating mount: {e}")
-        return None
+    def create(self, user_id: str, payload: Dict) -> Optional[Dict]:
+        """Create a new profile from a request payload"""
+        try:
+            if self.validator and not self.validator(payload):
+                return None
 
+            def mutator(data, now_iso):
+                obj = self._build(payload, {}, str(uuid.uuid4()), now_iso)
+                item = _to_dict(obj, self.field_names)
+                data['items'].append(item)
+                return item
 
-def get_mount(user_id: str, mount_id: str) -> Optional[Dict]:
-    """Get a specific mount profile"""
-    data = load_user_mounts(user_id)
-    for item in data['items']:
-        if item['id'] == mount_id:
-            return item
-    return None
+            return self._mutate(user_id, mutator)
+
+        except Exception as e:
+            logger.error(f"Error creating {self.singular}: {e}")
+            return None
 
+    def create_bulk(self, user_id: str, payloads: List[Dict]) -> Optional[List[Dict]]:
+        """Create many profiles with a single load and a single save.
+
+        Amortizes the serialize/fsync/rename cost over the whole batch —
+        N creates cost one disk write instead of N. All-or-nothing:
+        returns the created items, or None (persisting nothing) when a
+        payload fails validation or the save fails.
+        """
+        try:
+            if self.validator:
+                for payload in payloads:
+                    if not self.validator(payload):
+                        return None
+
+            def mutator(data, now_iso):
+                created = [
+                    _to_dict(self._build(payload, {}, str(uuid.uuid4()), now_iso), self.field_names)
+                    for payload in payloads
+                ]
+                data['items'].extend(created)
+                return created
+
+            return self._mutate(user_id, mutator)
+
+        except Exception as e:
+            logger.error(f"Error bulk-creating {self.kind}: {e}")
+            return None
 
-def update_mount(user_id: str, mount_id: str, mount_data: Dict) -> Optional[Dict]:
-    """Update a mount profile"""
-    try:
-        data = load_user_mounts(user_id)
-        
-        for i, item in enumerate(data['items']):
-            if item['id'] == mount_id:
-                mount = Mount(
-                    id=mount_id,
-                    name=mount_data['name'],
-                    manufacturer=mount_data.get('manufacturer', ''),
-                    mount_type=mount_data['mount_type'],
-                    payload_capacity_kg=float(mount_data['payload_capacity_kg']),
-                    recommended_payload_kg=0.0,
-                    tracking_accuracy_arcsec=float(mount_data['tracking_accuracy_arcsec']) if mount_data.get('tracking_accuracy_arcsec') else None,
-                    guiding_supported=mount_data.get('guiding_supported', False),
-                    notes=mount_data.get('notes', ''),
-                    created_at=item.get('created_at', datetime.now().isoformat()),
-                    updated_at=datetime.now().isoformat()
-                )
-                
-                data['items'][i] = asdict(mount)
-                
-                if save_user_mounts(user_id, data):
-                    return asdict(mount)
+    def update(self, user_id: str, item_id: str, payload: Dict) -> Optional[Dict]:
+        """Update an existing profile, preserving its created_at"""
+        try:
+            if self.validator and not self.validator(payload):
                 return None
-        
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error updating mount: {e}")
-        return None
 
+            def mutator(data, now_iso):
+                idx = _build_id_index(data['items']).get(item_id)
+                if idx is None:
+                    return None
+                obj = self._build(payload, data['items'][idx], item_id, now_iso)
+                item = _to_dict(obj, self.field_names)
+                data['items'][idx] = item
+                return item
 
-def delete_mount(user_id: str, mount_id: str) -> bool:
-    """Delete a mount profile"""
-    try:
-        data = load_user_mounts(user_id)
-        data['items'] = [item for item in data['items'] if item['id'] != mount_id]
-        return save_user_mounts(user_id, data)
-    except Exception as e:
-        logger.error(f"Error deleting mount: {e}")
-        return False
+            return self._mutate(user_id, mutator)
+
+        except Exception as e:
+            logger.error(f"Error updating {self.singular}: {e}")
+            return None
+
+    def delete(self, user_id: str, item_id: str) -> bool:
+        """Delete a profile by id.
+
+        Uses an O(1) swap-pop (the deleted slot takes the last item)
+        instead of rebuilding the list — profile order carries no
+        meaning, lookups always go through the id index.
+        """
+        try:
+            def mutator(data, _now_iso):
+                items = data['items']
+                idx = _build_id_index(items).get(item_id)
+                if idx is not None:
+                    last = items.pop()
+                    if idx != len(items):
+                        items[idx] = last
+                return True
+
+            return self._mutate(user_id, mutator) is not None
+        except Exception as e:
+            logger.error(f"Error deleting {self.singular}: {e}")
+            return False
 
 
 # ============================================================
-# CRUD Operations - Filters
+# Payload Builders & Validators
 # ============================================================
 
-def load_user_filters(user_id: str) -> Dict:
-    """Load user's filter profiles"""
-    file_path = get_user_equipment_file(user_id, 'filters')
-    
-    if not os.path.exists(file_path):
-        return {
-            'user_id': user_id,
-            'created_at': datetime.now().isoformat(),
-            'items': []
-        }
-    
-    try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Error loading filters for {user_id}: {e}")
-        return {
-            'user_id': user_id,
-            'created_at': datetime.now().isoformat(),
-            'items': []
-        }
+def _float_or_none(value, default=None):
+    """Convert empty strings / None to a default for optional float fields"""
+    if not value or value == '':
+        return default
+    return float(value)
+
+
+def _build_telescope(payload: Dict, item: Dict, item_id: str) -> Telescope:
+    """Map a request payload onto a Telescope (item holds prior values on update)"""
+    return Telescope(
+        id=item_id,
+        name=payload['name'],
+        manufacturer=payload.get('manufacturer', item.get('manufacturer', '')),
+        telescope_type=payload['telescope_type'],
+        aperture_mm=float(payload['aperture_mm']),
+        focal_length_mm=float(payload['focal_length_mm']),
+        weight_kg=_float_or_none(payload.get('weight_kg'), item.get('weight_kg', 0.0)),
+        reducer_barlow_factor=_float_or_none(payload.get('reducer_barlow_factor'), 1.0),
+        native_focal_ratio=0.0,  # Will be calculated
+        effective_focal_length=0.0,  # Will be calculated
+        effective_focal_ratio=0.0,  # Will be calculated
+        notes=payload.get('notes', '')
+    )
 
 
-def save_user_filters(user_id: str, data: Dict) -> bool:
-    """Save user's filter profiles with safety checks"""
-    file_path = get_user_equipment_file(user_id, 'filters')
-    data['updated_at'] = datetime.now().isoformat()
-    return safe_save_equipment(file_path, data)
+def _build_camera(payload: Dict, item: Dict, item_id: str) -> Camera:
+    """Map a request payload onto a Camera (item holds prior values on update)"""
+    return Camera(
+        id=item_id,
+        name=payload['name'],
+        manufacturer=payload['manufacturer'],
+        sensor_width_mm=float(payload['sensor_width_mm']),
+        sensor_height_mm=float(payload['sensor_height_mm']),
+        resolution_width_px=int(payload['resolution_width_px']),
+        resolution_height_px=int(payload['resolution_height_px']),
+        pixel_size_um=float(payload['pixel_size_um']),
+        sensor_type=payload['sensor_type'],
+        weight_kg=_float_or_none(payload.get('weight_kg'), item.get('weight_kg', 0.0)),
+        sensor_diagonal_mm=0.0,  # Will be calculated
+        cooling_supported=payload.get('cooling_supported', False),
+        min_temperature_c=_float_or_none(payload.get('min_temperature_c')),
+        read_noise_e=_float_or_none(payload.get('read_noise_e')),
+        quantum_efficiency=_float_or_none(payload.get('quantum_efficiency')),
+        notes=payload.get('notes', '')
+    )
 
 
-def create_filter(user_id: str, filter_data: Dict) -> Optional[Dict]:
-    """Create a new filter profile"""
-    try:
-        filter_obj = Filter(
-            id=str(uuid.uuid4()),
-            name=filter_data['name'],
-            manufacturer=filter_data.get('manufacturer', ''),
-            filter_type=filter_data['filter_type'],
-            central_wavelength_nm=float(filter_data['central_wavelength_nm']) if filter_data.get('central_wavelength_nm') else None,
-            bandwidth_nm=float(filter_data['bandwidth_nm']) if filter_data.get('bandwidth_nm') else None,
-            transmission_curve=filter_data.get('transmission_curve'),
-            intended_use=filter_data.get('intended_use', ''),
-            notes=filter_data.get('notes', ''),
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
-        )
-        
-        data = load_user_filters(user_id)
-        data['items'].append(asdict(filter_obj))
-        
-        if save_user_filters(user_id, data):
-            return asdict(filter_obj)
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error creating filter: {e}")
-        return None
+def _build_mount(payload: Dict, item: Dict, item_id: str) -> Mount:
+    """Map a request payload onto a Mount"""
+    return Mount(
+        id=item_id,
+        name=payload['name'],
+        manufacturer=payload.get('manufacturer', ''),
+        mount_type=payload['mount_type'],
+        payload_capacity_kg=float(payload['payload_capacity_kg']),
+        recommended_payload_kg=0.0,  # Will be calculated
+        tracking_accuracy_arcsec=float(payload['tracking_accuracy_arcsec']) if payload.get('tracking_accuracy_arcsec') else None,
+        guiding_supported=payload.get('guiding_supported', False),
+        notes=payload.get('notes', '')
+    )
 
 
-def get_filter(user_id: str, filter_id: str) -> Optional[Dict]:
-    """Get a specific filter profile"""
-    data = load_user_filters(user_id)
-    for item in data['items']:
-        if item['id'] == filter_id:
-            return item
-    return None
+def _build_filter(payload: Dict, item: Dict, item_id: str) -> Filter:
+    """Map a request payload onto a Filter"""
+    return Filter(
+        id=item_id,
+        name=payload['name'],
+        manufacturer=payload.get('manufacturer', ''),
+        filter_type=payload['filter_type'],
+        central_wavelength_nm=float(payload['central_wavelength_nm']) if payload.get('central_wavelength_nm') else None,
+        bandwidth_nm=float(payload['bandwidth_nm']) if payload.get('bandwidth_nm') else None,
+        transmission_curve=payload.get('transmission_curve'),
+        intended_use=payload.get('intended_use', ''),
+        notes=payload.get('notes', '')
+    )
 
 
-def update_filter(user_id: str, filter_id: str, filter_data: Dict) -> Optional[Dict]:
-    """Update a filter profile"""
-    try:
-        data = load_user_filters(user_id)
-        
-        for i, item in enumerate(data['items']):
-            if item['id'] == filter_id:
-                filter_obj = Filter(
-                    id=filter_id,
-                    name=filter_data['name'],
-                    manufacturer=filter_data.get('manufacturer', ''),
-                    filter_type=filter_data['filter_type'],
-                    central_wavelength_nm=float(filter_data['central_wavelength_nm']) if filter_data.get('central_wavelength_nm') else None,
-                    bandwidth_nm=float(filter_data['bandwidth_nm']) if filter_data.get('bandwidth_nm') else None,
-                    transmission_curve=filter_data.get('transmission_curve'),
-                    intended_use=filter_data.get('intended_use', ''),
-                    notes=filter_data.get('notes', ''),
-                    created_at=item.get('created_at', datetime.now().isoformat()),
-                    updated_at=datetime.now().isoformat()
-                )
-                
-                data['items'][i] = asdict(filter_obj)
-                
-                if save_user_filters(user_id, data):
-                    return asdict(filter_obj)
-                return None
-        
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error updating filter: {e}")
-        return None
+def _build_accessory(payload: Dict, item: Dict, item_id: str) -> Accessory:
+    """Map a request payload onto an Accessory (item holds prior values on update)"""
+    return Accessory(
+        id=item_id,
+        name=payload['name'],
+        manufacturer=payload.get('manufacturer', item.get('manufacturer', '')),
+        accessory_type=payload.get('accessory_type', item.get('accessory_type', '')),
+        weight_kg=_float_or_none(payload.get('weight_kg'), item.get('weight_kg', 0.0)),
+        notes=payload.get('notes', '')
+    )
 
 
-def delete_filter(user_id: str, filter_id: str) -> bool:
-    """Delete a filter profile"""
-    try:
-        data = load_user_filters(user_id)
-        data['items'] = [item for item in data['items'] if item['id'] != filter_id]
-        return save_user_filters(user_id, data)
-    except Exception as e:
-        logger.error(f"Error deleting filter: {e}")
+def _build_combination(payload: Dict, item: Dict, item_id: str) -> EquipmentCombination:
+    """Map a request payload onto an EquipmentCombination"""
+    return EquipmentCombination(
+        id=item_id,
+        name=payload['name'],
+        telescope_id=payload.get('telescope_id'),
+        camera_id=payload.get('camera_id'),
+        mount_id=payload.get('mount_id'),
+        filter_ids=payload.get('filter_ids', []),
+        accessory_ids=payload.get('accessory_ids', []),
+        notes=payload.get('notes', '')
+    )
+
+
+def _validate_combination(payload: Dict) -> bool:
+    """Validate: at minimum telescope or camera must be selected"""
+    if not payload.get('telescope_id') and not payload.get('camera_id'):
+        logger.error("At minimum a telescope or camera must be selected")
         return False
+    return True
+
+
+# Module-level store singletons — one per equipment kind
+TELESCOPES = EquipmentStore('telescopes', 'telescope', Telescope, _build_telescope)
+CAMERAS = EquipmentStore('cameras', 'camera', Camera, _build_camera)
+MOUNTS = EquipmentStore('mounts', 'mount', Mount, _build_mount)
+FILTERS = EquipmentStore('filters', 'filter', Filter, _build_filter)
+ACCESSORIES = EquipmentStore('accessories', 'accessory', Accessory, _build_accessory)
+COMBINATIONS = EquipmentStore('combinations', 'combination', EquipmentCombination,
+                              _build_combination, validator=_validate_combination)
 
 
 # ============================================================
-# CRUD Operations - Accessories
+# CRUD Operations - Telescopes
 # ============================================================
 
-def load_user_accessories(user_id: str) -> Dict:
-    """Load user's accessory profiles"""
-    file_path = get_user_equipment_file(user_id, 'accessories')
-    if not os.path.exists(file_path):
-        return {'items': [], 'created_at': datetime.now().isoformat(), 'updated_at': datetime.now().isoformat()}
-    try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Error loading accessories: {e}")
-        return {'items': [], 'created_at': datetime.now().isoformat(), 'updated_at': datetime.now().isoformat()}
+# Thin backwards-compatible wrappers around the telescope store
+load_user_telescopes = TELESCOPES.load
+save_user_telescopes = TELESCOPES.save
+create_telescope = TELESCOPES.create
+get_telescope = TELESCOPES.get
+update_telescope = TELESCOPES.update
+create_telescopes_bulk = TELESCOPES.create_bulk
 
 
-def save_user_accessories(user_id: str, data: Dict) -> bool:
-    """Save user's accessory profiles"""
-    file_path = get_user_equipment_file(user_id, 'accessories')
-    return safe_save_equipment(file_path, data)
+def delete_telescope(user_id: str, telescope_id: str) -> bool:
+    """Delete a telescope profile and its associated plan if it exists."""
+    result = TELESCOPES.delete(user_id, telescope_id)
+    if result:
+        # Cascade: remove the per-telescope plan file if present
+        try:
+            from plan_my_night import delete_plan_for_telescope
+            delete_plan_for_telescope(user_id, telescope_id)
+        except Exception as plan_error:
+            logger.warning(f'Could not delete plan for telescope {telescope_id}: {plan_error}')
+    return result
 
 
-def create_accessory(user_id: str, accessory_data: Dict) -> Optional[Dict]:
-    """Create a new accessory profile"""
-    try:
-        # Helper to convert empty strings to None for optional float fields
-        def get_float_or_none(value, default=None):
-            if not value or value == '':
-                return default
-            return float(value)
-        
-        accessory = Accessory(
-            id=str(uuid.uuid4()),
-            name=accessory_data['name'],
-            manufacturer=accessory_data.get('manufacturer', ''),
-            accessory_type=accessory_data.get('accessory_type', ''),
-            weight_kg=get_float_or_none(accessory_data.get('weight_kg'), 0.0),
-            notes=accessory_data.get('notes', ''),
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
-        )
-        
-        data = load_user_accessories(user_id)
-        data['items'].append(asdict(accessory))
-        
-        if save_user_accessories(user_id, data):
-            return asdict(accessory)
-        return None
-    except Exception as e:
-        logger.error(f"Error creating accessory: {e}")
-        return None
+# ============================================================
+# CRUD Operations - Cameras
+# ============================================================
 
+# Thin backwards-compatible wrappers around the camera store
+load_user_cameras = CAMERAS.load
+save_user_cameras = CAMERAS.save
+create_camera = CAMERAS.create
+get_camera = CAMERAS.get
+update_camera = CAMERAS.update
+delete_camera = CAMERAS.delete
+create_cameras_bulk = CAMERAS.create_bulk
 
-def get_accessory(user_id: str, accessory_id: str) -> Optional[Dict]:
-    """Get a specific accessory profile"""
-    data = load_user_accessories(user_id)
-    for item in data['items']:
-        if item['id'] == accessory_id:
-            return item
-    return None
 
+# ============================================================
+# CRUD Operations - Mounts
+# ============================================================
 
-def update_accessory(user_id: str, accessory_id: str, accessory_data: Dict) -> Optional[Dict]:
-    """Update an accessory profile"""
-    try:
-        # Helper to convert empty strings to None for optional float fields
-        def get_float_or_none(value, default=None):
-            if not value or value == '':
-                return default
-            return float(value)
-        
-        data = load_user_accessories(user_id)
-        
-        for i, item in enumerate(data['items']):
-            if item['id'] == accessory_id:
-                accessory = Accessory(
-                    id=accessory_id,
-                    name=accessory_data['name'],
-                    manufacturer=accessory_data.get('manufacturer', item.get('manufacturer', '')),
-                    accessory_type=accessory_data.get('accessory_type', item.get('accessory_type', '')),
-                    weight_kg=get_float_or_none(accessory_data.get('weight_kg'), item.get('weight_kg', 0.0)),
-                    notes=accessory_data.get('notes', ''),
-                    created_at=item.get('created_at', datetime.now().isoformat()),
-                    updated_at=datetime.now().isoformat()
-                )
-                
-                data['items'][i] = asdict(accessory)
-                
-                if save_user_accessories(user_id, data):
-                    return asdict(accessory)
-                return None
-        
-        return None
-    except Exception as e:
-        logger.error(f"Error updating accessory: {e}")
-        return None
+# Thin backwards-compatible wrappers around the mount store
+load_user_mounts = MOUNTS.load
+save_user_mounts = MOUNTS.save
+create_mount = MOUNTS.create
+get_mount = MOUNTS.get
+update_mount = MOUNTS.update
+delete_mount = MOUNTS.delete
+create_mounts_bulk = MOUNTS.create_bulk
 
 
-def delete_accessory(user_id: str, accessory_id: str) -> bool:
-    """Delete an accessory profile"""
-    try:
-        data = load_user_accessories(user_id)
-        data['items'] = [item for item in data['items'] if item['id'] != accessory_id]
-        return save_user_accessories(user_id, data)
-    except Exception as e:
-        logger.error(f"Error deleting accessory: {e}")
-        return False
+# ============================================================
+# CRUD Operations - Filters
+# ============================================================
+
+# Thin backwards-compatible wrappers around the filter store
+load_user_filters = FILTERS.load
+save_user_filters = FILTERS.save
+create_filter = FILTERS.create
+get_filter = FILTERS.get
+update_filter = FILTERS.update
+delete_filter = FILTERS.delete
+create_filters_bulk = FILTERS.create_bulk
+
+
+# ============================================================
+# CRUD Operations - Accessories
+# ============================================================
+
+# Thin backwards-compatible wrappers around the accessory store
+load_user_accessories = ACCESSORIES.load
+save_user_accessories = ACCESSORIES.save
+create_accessory = ACCESSORIES.create
+get_accessory = ACCESSORIES.get
+update_accessory = ACCESSORIES.update
+delete_accessory = ACCESSORIES.delete
+create_accessories_bulk = ACCESSORIES.create_bulk
 
 
 # ============================================================
@@ -1017,16 +1206,40 @@ def calculate_fov(
     Returns:
         FOVCalculation object with all calculated values
     """
-    import math
-    
-    # FOV (degrees) = 57.3 × sensor dimension / focal length
-    horizontal_fov_deg = round(57.3 * camera_sensor_width_mm / telescope_focal_length_mm, 4)
-    vertical_fov_deg = round(57.3 * camera_sensor_height_mm / telescope_focal_length_mm, 4)
-    
+    return FOVCalculation(*_calculate_fov_cached(
+        telescope_focal_length_mm,
+        camera_sensor_width_mm,
+        camera_sensor_height_mm,
+        camera_pixel_size_um,
+        seeing_arcsec
+    ))
+
+
+@functools.lru_cache(maxsize=1024)
+def _calculate_fov_cached(
+    telescope_focal_length_mm: float,
+    camera_sensor_width_mm: float,
+    camera_sensor_height_mm: float,
+    camera_pixel_size_um: float,
+    seeing_arcsec: float
+) -> Tuple[float, float, float, float, str]:
+    """Memoized FOV math — users re-analyze the same fixed rigs.
+
+    Returns a frozen value tuple rather than the FOVCalculation itself:
+    callers mutate telescope_name/camera_name on the result, so each
+    call must get a fresh instance.
+    """
+    # One shared reciprocal: FOV (degrees) = 57.3 × sensor dimension / focal length
+    inv_fl = 57.3 / telescope_focal_length_mm
+    w = camera_sensor_width_mm
+    h = camera_sensor_height_mm
+
+    horizontal_fov_deg = round(w * inv_fl, 4)
+    vertical_fov_deg = round(h * inv_fl, 4)
+
     # Diagonal FOV
-    sensor_diagonal_mm = math.sqrt(camera_sensor_width_mm**2 + camera_sensor_height_mm**2)
-    diagonal_fov_deg = round(57.3 * sensor_diagonal_mm / telescope_focal_length_mm, 4)
-    
+    diagonal_fov_deg = round(math.sqrt(w * w + h * h) * inv_fl, 4)
+
     # Image scale (arcsec/pixel) = 206.265 × pixel size (µm) / focal length (mm)
     # Note: pixel size stays in micrometers, NOT converted to mm
     image_scale_arcsec_per_px = round(206.265 * camera_pixel_size_um / telescope_focal_length_mm, 4)
@@ -1043,13 +1256,13 @@ def calculate_fov(
         sampling_classification = SamplingClassification.UNDERSAMPLED.value
     else:
         sampling_classification = SamplingClassification.OPTIMAL.value
-    
-    return FOVCalculation(
-        horizontal_fov_deg=horizontal_fov_deg,
-        vertical_fov_deg=vertical_fov_deg,
-        diagonal_fov_deg=diagonal_fov_deg,
-        image_scale_arcsec_per_px=image_scale_arcsec_per_px,
-        sampling_classification=sampling_classification
+
+    return (
+        horizontal_fov_deg,
+        vertical_fov_deg,
+        diagonal_fov_deg,
+        image_scale_arcsec_per_px,
+        sampling_classification,
     )
 
 
@@ -1057,236 +1270,154 @@ def calculate_fov(
 # CRUD Operations - Equipment Combinations
 # ============================================================
 
-def load_user_combinations(user_id: str) -> Dict:
-    """Load user's equipment combinations"""
-    file_path = get_user_equipment_file(user_id, 'combinations')
-    
-    if not os.path.exists(file_path):
-        return {
-            'user_id': user_id,
-            'created_at': datetime.now().isoformat(),
-            'items': []
-        }
-    
-    try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Error loading combinations for {user_id}: {e}")
-        return {
-            'user_id': user_id,
-            'created_at': datetime.now().isoformat(),
-            'items': []
-        }
-
-
-def save_user_combinations(user_id: str, data: Dict) -> bool:
-    """Save user's equipment combinations with safety checks"""
-    file_path = get_user_equipment_file(user_id, 'combinations')
-    data['updated_at'] = datetime.now().isoformat()
-    return safe_save_equipment(file_path, data)
+# Thin backwards-compatible wrappers around the combination store
+load_user_combinations = COMBINATIONS.load
+save_user_combinations = COMBINATIONS.save
+create_combination = COMBINATIONS.create
+get_combination = COMBINATIONS.get
+update_combination = COMBINATIONS.update
+delete_combination = COMBINATIONS.delete
+create_combinations_bulk = COMBINATIONS.create_bulk
 
 
-def create_combination(user_id: str, combination_data: Dict) -> Optional[Dict]:
-    """Create a new equipment combination"""
-    try:
-        # Validate: at minimum telescope or camera must be selected
-        if not combination_data.get('telescope_id') and not combination_data.get('camera_id'):
-            logger.error("At minimum a telescope or camera must be selected")
-            return None
-        
-        combination = EquipmentCombination(
-            id=str(uuid.uuid4()),
-            name=combination_data['name'],
-            telescope_id=combination_data.get('telescope_id'),
-            camera_id=combination_data.get('camera_id'),
-            mount_id=combination_data.get('mount_id'),
-            filter_ids=combination_data.get('filter_ids', []),
-            accessory_ids=combination_data.get('accessory_ids', []),
-            notes=combination_data.get('notes', ''),
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
-        )
-        
-        data = load_user_combinations(user_id)
-        data['items'].append(asdict(combination))
-        
-        if save_user_combinations(user_id, data):
-            return asdict(combination)
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error creating combination: {e}")
-        return None
+# ============================================================
+# Equipment Combination Analysis
+# ============================================================
 
+def _kind_id_index(blob: Dict, kind: str) -> Dict[str, Dict]:
+    """Build an id -> item map for one kind of an already-loaded blob"""
+    return {item['id']: item for item in blob[kind].get('items', []) if 'id' in item}
 
-def get_combination(user_id: str, combination_id: str) -> Optional[Dict]:
-    """Get a specific equipment combination"""
-    data = load_user_combinations(user_id)
-    for item in data['items']:
-        if item['id'] == combination_id:
-            return item
-    return None
 
+def analyze_combination(user_id: str, combination_id: str) -> Optional[CombinationAnalysis]:
+    """Analyze an equipment combination for imaging suitability.
 
-def update_combination(user_id: str, combination_id: str, combination_data: Dict) -> Optional[Dict]:
-    """Update an equipment combination"""
+    Exception scope is deliberately narrow — only the I/O load and the
+    numeric conversions are guarded; the dict-shuffling body raises on
+    genuine bugs rather than logging them away.
+    """
+    # One blob load serves every lookup below — per-id get_* calls
+    # would re-scan the document once per referenced item
     try:
-        data = load_user_combinations(user_id)
-        
-        for i, item in enumerate(data['items']):
-            if item['id'] == combination_id:
-                # Validate: at minimum telescope or camera must be selected
-                if not combination_data.get('telescope_id') and not combination_data.get('camera_id'):
-                    logger.error("At minimum a telescope or camera must be selected")
-                    return None
-                
-                combination = EquipmentCombination(
-                    id=combination_id,
-                    name=combination_data['name'],
-                    telescope_id=combination_data.get('telescope_id'),
-                    camera_id=combination_data.get('camera_id'),
-                    mount_id=combination_data.get('mount_id'),
-                    filter_ids=combination_data.get('filter_ids', []),
-                    accessory_ids=combination_data.get('accessory_ids', []),
-                    notes=combination_data.get('notes', ''),
-                    created_at=item.get('created_at', datetime.now().isoformat()),
-                    updated_at=datetime.now().isoformat()
-                )
-                
-                data['items'][i] = asdict(combination)
-                
-                if save_user_combinations(user_id, data):
-                    return asdict(combination)
-                return None
-        
-        return None
-        
+        blob = _load_user_blob(user_id)
     except Exception as e:
-        logger.error(f"Error updating combination: {e}")
+        logger.error(f"Error loading equipment for combination analysis: {e}")
         return None
 
+    combination = _kind_id_index(blob, 'combinations').get(combination_id)
+    if not combination:
+        return None
 
-def delete_combination(user_id: str, combination_id: str) -> bool:
-    """Delete an equipment combination"""
-    try:
-        data = load_user_combinations(user_id)
-        data['items'] = [item for item in data['items'] if item['id'] != combination_id]
-        return save_user_combinations(user_id, data)
-    except Exception as e:
-        logger.error(f"Error deleting combination: {e}")
-        return False
-
-
-# ============================================================
-# Equipment Combination Analysis
-# ============================================================
-
-def analyze_combination(user_id: str, combination_id: str) -> Optional[CombinationAnalysis]:
-    """Analyze an equipment combination for imaging suitability"""
-    try:
-        combination = get_combination(user_id, combination_id)
-        if not combination:
-            return None
-
-        telescope_id_value = combination.get('telescope_id')
-        camera_id_value = combination.get('camera_id')
-        mount_id_value = combination.get('mount_id')
-
-        telescope_id: Optional[str] = telescope_id_value if isinstance(telescope_id_value, str) else None
-        camera_id: Optional[str] = camera_id_value if isinstance(camera_id_value, str) else None
-        mount_id: Optional[str] = mount_id_value if isinstance(mount_id_value, str) else None
-
-        telescope = get_telescope(user_id, telescope_id) if telescope_id else None
-        camera = get_camera(user_id, camera_id) if camera_id else None
-        mount = get_mount(user_id, mount_id) if mount_id else None
-
-        filter_items: List[Dict] = []
-        for filter_id in combination.get('filter_ids', []) or []:
-            filter_obj = get_filter(user_id, filter_id)
-            if filter_obj:
-                filter_items.append(filter_obj)
-
-        accessory_items: List[Dict] = []
-        for accessory_id in combination.get('accessory_ids', []) or []:
-            accessory_obj = get_accessory(user_id, accessory_id)
-            if accessory_obj:
-                accessory_items.append(accessory_obj)
-
-        fov_result = None
-        suitability: List[str] = []
-        recommendations: List[str] = []
-
-        if telescope and camera:
-            focal_length = telescope.get('effective_focal_length') or telescope.get('focal_length_mm')
-            if focal_length and camera.get('sensor_width_mm') and camera.get('sensor_height_mm') and camera.get('pixel_size_um'):
-                fov_result = calculate_fov(
-                    telescope_focal_length_mm=float(focal_length),
-                    camera_sensor_width_mm=float(camera['sensor_width_mm']),
-                    camera_sensor_height_mm=float(camera['sensor_height_mm']),
-                    camera_pixel_size_um=float(camera['pixel_size_um'])
-                )
-                fov_result.telescope_name = telescope.get('name', '')
-                fov_result.camera_name = camera.get('name', '')
-
-                if fov_result.sampling_classification == SamplingClassification.OPTIMAL.value:
-                    suitability.append("Balanced setup for typical seeing conditions")
-                elif fov_result.sampling_classification == SamplingClassification.UNDERSAMPLED.value:
-                    suitability.append("Better suited for wide-field targets")
-                    recommendations.append("Use a longer focal length or smaller pixel camera for finer details")
-                else:
-                    suitability.append("Better suited for high-resolution imaging")
-                    recommendations.append("Use binning or shorter focal length for easier guiding")
-
-                if fov_result.diagonal_fov_deg >= 2.0:
-                    suitability.append("Well suited for large nebulae and wide fields")
-                elif fov_result.diagonal_fov_deg <= 0.5:
-                    suitability.append("Well suited for compact targets like galaxies and planetary nebulae")
+    telescope_id_value = combination.get('telescope_id')
+    camera_id_value = combination.get('camera_id')
+    mount_id_value = combination.get('mount_id')
+
+    telescope_id: Optional[str] = telescope_id_value if isinstance(telescope_id_value, str) else None
+    camera_id: Optional[str] = camera_id_value if isinstance(camera_id_value, str) else None
+    mount_id: Optional[str] = mount_id_value if isinstance(mount_id_value, str) else None
+
+    telescope = _kind_id_index(blob, 'telescopes').get(telescope_id) if telescope_id else None
+    camera = _kind_id_index(blob, 'cameras').get(camera_id) if camera_id else None
+    mount = _kind_id_index(blob, 'mounts').get(mount_id) if mount_id else None
+
+    filter_index = _kind_id_index(blob, 'filters')
+    filter_items: List[Dict] = [
+        filter_index[filter_id]
+        for filter_id in combination.get('filter_ids', []) or []
+        if filter_id in filter_index
+    ]
+
+    accessory_index = _kind_id_index(blob, 'accessories')
+    accessory_items: List[Dict] = [
+        accessory_index[accessory_id]
+        for accessory_id in combination.get('accessory_ids', []) or []
+        if accessory_id in accessory_index
+    ]
+
+    fov_result = None
+    suitability: List[str] = []
+    recommendations: List[str] = []
+
+    if telescope and camera:
+        # Single guard over the full spec tuple — calculate_fov takes
+        # (focal_length, sensor_width, sensor_height, pixel_size)
+        specs = (
+            telescope.get('effective_focal_length') or telescope.get('focal_length_mm'),
+            camera.get('sensor_width_mm'),
+            camera.get('sensor_height_mm'),
+            camera.get('pixel_size_um'),
+        )
+        if all(specs):
+            try:
+                fov_result = calculate_fov(*map(float, specs))
+            except (TypeError, ValueError) as e:
+                logger.error(f"Invalid optical specs on combination {combination_id}: {e}")
+                fov_result = None
+
+        if fov_result is not None:
+            fov_result.telescope_name = telescope.get('name', '')
+            fov_result.camera_name = camera.get('name', '')
+
+            if fov_result.sampling_classification == SamplingClassification.OPTIMAL.value:
+                suitability.append("Balanced setup for typical seeing conditions")
+            elif fov_result.sampling_classification == SamplingClassification.UNDERSAMPLED.value:
+                suitability.append("Better suited for wide-field targets")
+                recommendations.append("Use a longer focal length or smaller pixel camera for finer details")
             else:
-                recommendations.append("Complete telescope and camera specifications to compute FOV")
+                suitability.append("Better suited for high-resolution imaging")
+                recommendations.append("Use binning or shorter focal length for easier guiding")
+
+            if fov_result.diagonal_fov_deg >= 2.0:
+                suitability.append("Well suited for large nebulae and wide fields")
+            elif fov_result.diagonal_fov_deg <= 0.5:
+                suitability.append("Well suited for compact targets like galaxies and planetary nebulae")
         else:
-            recommendations.append("Select both a telescope and a camera for full optical analysis")
+            recommendations.append("Complete telescope and camera specifications to compute FOV")
+    else:
+        recommendations.append("Select both a telescope and a camera for full optical analysis")
 
-        if mount and telescope:
+    if mount and telescope:
+        try:
             camera_weight = float(camera.get('weight_kg', 0.0) or 0.0) if camera else 0.0
             total_payload = float(telescope.get('weight_kg', 0.0) or 0.0) + camera_weight
             recommended_payload = float(mount.get('recommended_payload_kg', 0.0) or 0.0)
-            if total_payload > 0 and recommended_payload > 0:
-                if total_payload <= recommended_payload:
-                    suitability.append("Payload is within recommended mount limits")
-                else:
-                    recommendations.append("Payload may be too high for optimal tracking performance")
-
-        if not suitability:
-            suitability.append("Basic equipment combination is valid")
-        if not recommendations:
-            recommendations.append("No critical issues detected")
-
-        return CombinationAnalysis(
-            combination_id=combination_id,
-            telescope=telescope,
-            camera=camera,
-            mount=mount,
-            filters=filter_items,
-            accessories=accessory_items,
-            fov_calculation=fov_result,
-            suitability=suitability,
-            recommendations=recommendations
-        )
-    except Exception as e:
-        logger.error(f"Error analyzing combination: {e}")
-        return None
+        except (TypeError, ValueError) as e:
+            logger.error(f"Invalid weight specs on combination {combination_id}: {e}")
+            total_payload = recommended_payload = 0.0
+        if total_payload > 0 and recommended_payload > 0:
+            if total_payload <= recommended_payload:
+                suitability.append("Payload is within recommended mount limits")
+            else:
+                recommendations.append("Payload may be too high for optimal tracking performance")
+
+    if not suitability:
+        suitability.append("Basic equipment combination is valid")
+    if not recommendations:
+        recommendations.append("No critical issues detected")
+
+    return CombinationAnalysis(
+        combination_id=combination_id,
+        telescope=telescope,
+        camera=camera,
+        mount=mount,
+        filters=filter_items,
+        accessories=accessory_items,
+        fov_calculation=fov_result,
+        suitability=suitability,
+        recommendations=recommendations
+    )
 
 # ============================================================
 # Utility Functions
 # ============================================================
 
 def get_all_equipment_summary(user_id: str) -> Dict:
-    """Get a summary of all user equipment"""
+    """Get a summary of all user equipment (single file read)"""
+    blob = _load_user_blob(user_id)
     return {
-        'telescopes_count': len(load_user_telescopes(user_id).get('items', [])),
-        'cameras_count': len(load_user_cameras(user_id).get('items', [])),
-        'mounts_count': len(load_user_mounts(user_id).get('items', [])),
-        'filters_count': len(load_user_filters(user_id).get('items', [])),
-        'combinations_count': len(load_user_combinations(user_id).get('items', []))
+        'telescopes_count': len(blob['telescopes'].get('items', [])),
+        'cameras_count': len(blob['cameras'].get('items', [])),
+        'mounts_count': len(blob['mounts'].get('items', [])),
+        'filters_count': len(blob['filters'].get('items', [])),
+        'combinations_count': len(blob['combinations'].get('items', []))
     }
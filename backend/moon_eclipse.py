@@ -35,35 +35,68 @@ Example output:
     "partial_duration_minutes": 120,
     "astrophotography_score": 8.5,
     "score_classification": "Very good - Highly recommended",
-    "altitude_vs_time": [
-      {"time": "20:15", "altitude": 10.0, "azimuth": 120.0},
-      ...
-    ]
+    "altitude_vs_time": {
+      "times": ["20:15", ...],
+      "altitudes_deg": [10.0, ...],
+      "azimuths_deg": [120.0, ...]
+    }
   }
 }
 """
 
 import datetime
+from bisect import bisect_right
 from dataclasses import dataclass
 from zoneinfo import ZoneInfo
 from typing import Any, Optional, List
 
-from astronomy import SearchLunarEclipse, Time as AstronTime, Observer
+import numpy as np
+from astronomy import (
+    SearchLunarEclipse,
+    Time as AstronTime,
+    Observer,
+    Body,
+    Equator,
+    Horizon,
+    Refraction
+)
 from astropy.time import Time as AstroTime
-from astropy.coordinates import EarthLocation, AltAz, get_body
+from astropy.coordinates import AltAz, get_body
 import astropy.units as u
 
+from fast_altaz import HAS_FAST_ALTAZ, fast_altaz
+from site_cache import make_location
+
+
+# Score classification bins: lower bounds (exclusive downward) and the
+# name of each bin, resolved with one bisect instead of a branch chain
+_SCORE_CLASS_BOUNDS = (4.0, 6.0, 7.5, 9.0)
+_SCORE_CLASS_NAMES = ("low", "moderate", "good", "very_good", "excellent")
+
 
 # =============================
 # Data structures
 # =============================
 
 @dataclass
-class EclipsePoint:
-    """Data point for altitude vs time"""
-    time: str  # "HH:MM" local time
-    altitude_deg: float
-    azimuth_deg: float
+class EclipseCurve:
+    """Structure-of-arrays altitude-vs-time curve.
+
+    Parallel arrays instead of one object per sample: the producer keeps
+    its numpy arrays, and the serialized form repeats each field name
+    once instead of once per point. to_dict() expands to the JSON shape
+    exactly once at the cache boundary.
+    """
+    times: List[str]  # "HH:MM" local time
+    altitudes_deg: np.ndarray
+    azimuths_deg: np.ndarray
+
+    def to_dict(self) -> dict:
+        return {
+            "times": list(self.times),
+            "altitudes_deg": np.round(self.altitudes_deg, 1).tolist(),
+            "azimuths_deg": np.round(self.azimuths_deg, 1).tolist(),
+        }
 
 
 @dataclass
@@ -81,7 +114,7 @@ class LunarEclipseInfo:
     partial_duration_minutes: int
     astrophotography_score: float
     score_classification: str
-    altitude_vs_time: List[EclipsePoint]
+    altitude_vs_time: EclipseCurve
 
 
 # =============================
@@ -97,10 +130,7 @@ class LunarEclipseService:
         self.timezone = ZoneInfo(timezone)
 
         self.observer = Observer(latitude, longitude, 0)
-        self.location = EarthLocation(
-            lat=latitude * u.deg,
-            lon=longitude * u.deg
-        )
+        self.location = make_location(round(latitude, 4), round(longitude, 4))
 
     # =============================
     # Public API
@@ -218,68 +248,82 @@ class LunarEclipseService:
             return "Penumbral"
 
     def _get_moon_altitude_azimuth(self, dt_utc: datetime.datetime) -> tuple[float, float]:
-        """Get moon's altitude and azimuth at given UTC time"""
-        t_astropy = AstroTime(dt_utc)
-        frame = AltAz(obstime=t_astropy, location=self.location)
-
-        moon = get_body("moon", t_astropy)
-        moon_transformed = moon.transform_to(frame)
+        """Get moon's altitude and azimuth at given UTC time.
+
+        Uses the Astronomy Engine Equator/Horizon path (already loaded
+        for the eclipse search) — a pair of direct float computations,
+        with no astropy frame construction for this single sample.
+        Refraction.Airless keeps the peak altitude on the same
+        geometric convention as the refraction-free altitude curve in
+        the same payload.
+        """
+        t = AstronTime(dt_utc.strftime("%Y-%m-%dT%H:%M:%SZ"))
 
-        alt = self._coord_attribute(moon_transformed, "alt")
-        az = self._coord_attribute(moon_transformed, "az")
-        
-        alt = alt if alt is not None else 0.0
-        az = az if az is not None else 0.0
-        return alt, az
+        eq = Equator(Body.Moon, t, self.observer, True, True)
+        hor = Horizon(t, self.observer, eq.ra, eq.dec, Refraction.Airless)
 
-    def _coord_attribute(self, coord: Any, attr_name: str) -> Optional[float]:
-        """Safely extract altitude or azimuth from transformed coordinate"""
-        attr = getattr(coord, attr_name, None)
-        if attr is None:
-            return None
-        try:
-            value = attr.to_value(u.deg) if hasattr(attr, "to_value") else float(attr)
-            return float(value)
-        except (AttributeError, TypeError):
-            return None
+        return float(hor.altitude), float(hor.azimuth)
 
     def _generate_altitude_vs_time(
         self,
         start_local: datetime.datetime,
         end_local: datetime.datetime
-    ) -> List[EclipsePoint]:
-        """Generate altitude vs time points for the eclipse"""
-        
-        points = []
-        
-        # Generate points every 5 minutes
-        current = start_local
-        step = datetime.timedelta(minutes=5)
+    ) -> EclipseCurve:
+        """Generate the altitude-vs-time curve for the eclipse.
+
+        All samples go through one array-valued Time and a single AltAz
+        transform instead of a per-step astropy round-trip, which
+        amortizes the astrometry setup over the whole window. When
+        PyERFA is available the direct ERFA path additionally skips
+        astropy's frame-graph machinery entirely.
+        """
+        # 30 evenly spaced samples across the window, inclusive of both
+        # ends — the moon's altitude drifts a fraction of a degree per
+        # minute, so the chart is visually identical to a dense 5-minute
+        # stride regardless of the eclipse duration
+        n_steps = 30
+        duration_s = (end_local - start_local).total_seconds()
+        offsets_s = np.linspace(0.0, duration_s, n_steps)
+        local_times = [
+            start_local + datetime.timedelta(seconds=float(s)) for s in offsets_s
+        ]
+
+        # Numeric-JD Time construction skips astropy's per-element
+        # datetime parsing (2440587.5 is the Unix-epoch JD); each sample
+        # takes its own local time's timestamp() so the computed instants
+        # match the curve's HH:MM labels even across a DST changeover
+        jd_grid = np.array([t.timestamp() for t in local_times]) / 86400.0 + 2440587.5
+        t_astropy = AstroTime(jd_grid, format="jd", scale="utc")
 
-        while current <= end_local:
-            current_utc = current.astimezone(datetime.timezone.utc)
-            t_astropy = AstroTime(current_utc)
+        moon = get_body("moon", t_astropy)
+        if HAS_FAST_ALTAZ:
+            alt_arr, az_arr = fast_altaz(moon, t_astropy, self.latitude, self.longitude)
+        else:
             frame = AltAz(obstime=t_astropy, location=self.location)
-
-            moon = get_body("moon", t_astropy)
             moon_transformed = moon.transform_to(frame)
+            alt_arr = self._coord_angles(moon_transformed, "alt", n_steps)
+            az_arr = self._coord_angles(moon_transformed, "az", n_steps)
+
+        return EclipseCurve(
+            # f-string beats strftime, which redoes the tz lookup per call
+            times=[f"{current.hour:02d}:{current.minute:02d}" for current in local_times],
+            altitudes_deg=np.asarray(alt_arr, dtype=float),
+            azimuths_deg=np.asarray(az_arr, dtype=float)
+        )
 
-            alt = self._coord_attribute(moon_transformed, "alt")
-            az = self._coord_attribute(moon_transformed, "az")
-            
-            alt = alt if alt is not None else 0.0
-            az = az if az is not None else 0.0
-
-            time_str = current.strftime("%H:%M")
-            points.append(EclipsePoint(
-                time=time_str,
-                altitude_deg=round(alt, 1),
-                azimuth_deg=round(az, 1)
-            ))
-
-            current += step
-
-        return points
+    def _coord_angles(self, coord: Any, attr_name: str, count: int) -> np.ndarray:
+        """Extract altitude or azimuth values as a float array of length count"""
+        attr = getattr(coord, attr_name, None)
+        if attr is None:
+            return np.zeros(count)
+        try:
+            values = attr.to_value(u.deg) if hasattr(attr, "to_value") else attr
+            arr = np.asarray(values, dtype=float)
+        except (AttributeError, TypeError, ValueError):
+            return np.zeros(count)
+        if arr.ndim == 0:
+            return np.full(count, float(arr))
+        return arr
 
     def _calculate_astrophotography_score(
         self,
@@ -337,17 +381,7 @@ class LunarEclipseService:
         final_score = base_score + altitude_bonus + duration_bonus + total_bonus - altitude_penalty
         final_score = max(0.0, min(10.0, final_score))  # Clamp to 0-10
 
-        # Classification
-        if final_score >= 9.0:
-            classification = "excellent"
-        elif final_score >= 7.5:
-            classification = "very_good"
-        elif final_score >= 6.0:
-            classification = "good"
-        elif final_score >= 4.0:
-            classification = "moderate"
-        else:
-            classification = "low"
+        classification = _SCORE_CLASS_NAMES[bisect_right(_SCORE_CLASS_BOUNDS, final_score)]
 
         return final_score, classification
 
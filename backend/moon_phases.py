@@ -37,10 +37,12 @@ Example output for current Moon status (on API call):
 """
 
 import datetime
+from bisect import bisect_right
 from dataclasses import dataclass
 from zoneinfo import ZoneInfo
 import math
-from typing import Any, Optional, cast
+
+import numpy as np
 
 from astronomy import (
     Time,
@@ -56,9 +58,12 @@ from astronomy import (
 )
 
 from astropy.time import Time as AstroTime
-from astropy.coordinates import EarthLocation, AltAz, get_sun, get_body
+from astropy.coordinates import AltAz, get_sun, get_body
+from astropy.coordinates.erfa_astrom import erfa_astrom, ErfaAstromInterpolator
 import astropy.units as u
 
+from site_cache import make_location
+
 
 @dataclass
 class MoonAstroPhotoInfo:
@@ -88,10 +93,7 @@ class MoonService:
 
         self.observer = Observer(latitude, longitude, 0)
 
-        self.location = EarthLocation(
-            lat=latitude * u.deg,
-            lon=longitude * u.deg
-        )
+        self.location = make_location(round(latitude, 4), round(longitude, 4))
 
     def get_report(self) -> MoonAstroPhotoInfo:
         # --- Now UTC & local ---
@@ -144,32 +146,23 @@ class MoonService:
             next_dark_night_end=dark_end
         )
 
+    # Phase-angle bins over [0°, 360°): upper bounds and their names.
+    # angle < 180° is the waxing half, so each bin already carries the
+    # right waxing/waning variant.
+    _PHASE_BOUNDS = (10, 90, 100, 170, 190, 260, 280)
+    _PHASE_NAMES = (
+        "New Moon",
+        "Waxing Crescent",
+        "First Quarter",
+        "Waxing Gibbous",
+        "Full Moon",
+        "Waning Gibbous",
+        "Last Quarter",
+        "Waning Crescent",
+    )
+
     def _phase_name(self, angle: float) -> str:
-        
-        # Determine if waxing or waning
-        if angle < 180:
-            waxing = True
-        else:
-            waxing = False
-
-        if angle < 10:
-            name = "New Moon"
-        elif angle < 90:
-            name = "Waxing Crescent" if waxing else "Waning Crescent"
-        elif angle < 100:
-            name = "First Quarter" if waxing else "Last Quarter"
-        elif angle < 170:
-            name = "Waxing Gibbous" if waxing else "Waning Gibbous"
-        elif angle < 190:
-            name = "Full Moon"
-        elif angle < 260:
-            name = "Waning Gibbous" if not waxing else "Waxing Gibbous"
-        elif angle < 280:
-            name = "Last Quarter" if not waxing else "First Quarter"
-        else:
-            name = "Waning Crescent" if not waxing else "Waxing Crescent"
-
-        return name
+        return self._PHASE_NAMES[bisect_right(self._PHASE_BOUNDS, angle)]
 
     def _fmt(self, astro_time_obj) -> str:
         """
@@ -192,45 +185,84 @@ class MoonService:
         return dt_local.isoformat(timespec='minutes')  # ex: "2026-02-03T20:28:00+01:00"
 
     def _next_astronomical_dark_window(self, start_local: datetime.datetime):
-        dt = start_local
-        found_start = None
-
-        for _ in range(60 * 24 * 10):  # search up to 10 days
-            utc = dt.astimezone(datetime.timezone.utc)
-            t_astropy = AstroTime(utc)
-
-            frame = AltAz(obstime=t_astropy, location=self.location)
-            sun_alt = self._coord_altitude_deg(get_sun(t_astropy), frame)
-            moon_alt = self._coord_altitude_deg(get_body("moon", t_astropy), frame)
-
-            if sun_alt is None or moon_alt is None:
-                dt += datetime.timedelta(minutes=5)
-                continue
-
-            if sun_alt < -18 and moon_alt < 0:
-                if found_start is None:
-                    found_start = dt
-            else:
-                if found_start is not None:
-                    return (
-                        self._fmt_time(found_start),
-                        self._fmt_time(dt)
-                    )
-            dt += datetime.timedelta(minutes=5)
-
-        return ("Not found", "Not found")
-
-    def _coord_altitude_deg(self, coord: Any, frame: AltAz) -> Optional[float]:
-        if coord is None:
-            return None
-
-        transformed = coord.transform_to(frame)
-        alt = getattr(transformed, "alt", None)
-        if alt is None:
-            return None
-
-        value = alt.to_value(u.deg) if hasattr(alt, "to_value") else None
-        if value is None:
-            return None
-
-        return float(cast(Any, value))
+        """Search up to 10 days for the next sun < -18° / moon < 0° window.
+
+        Two-stage scan: a coarse 30-minute sun-only pass locates the
+        astronomical-night blocks, then the 5-minute sun + moon
+        refinement runs only inside those blocks. A block shorter than
+        the coarse stride can in principle still slip between samples —
+        near the latitude band where the sun only just dips below -18°,
+        astronomical night can last under an hour at the edges of the
+        season, which is why the stride is half an hour rather than the
+        hour the block length would normally justify. Each stage is a
+        single array Time and AltAz frame, and the fine stage samples
+        roughly a third of the 10-day horizon instead of all of it. The
+        moon window itself can be much shorter than the stride, which is
+        why the moon is only evaluated at fine resolution.
+        """
+        step_seconds = 5 * 60
+        coarse_seconds = 1800
+        horizon_seconds = 10 * 24 * 3600
+
+        def _wall_clock_jds(offsets_s):
+            # Per-sample wall-clock timestamps keep each instant aligned
+            # with the reported local times across DST changeovers;
+            # numeric JD skips astropy's per-element datetime parsing
+            # (2440587.5 is the Unix-epoch JD)
+            return np.array([
+                (start_local + datetime.timedelta(seconds=int(s))).timestamp()
+                for s in offsets_s
+            ]) / 86400.0 + 2440587.5
+
+        coarse_offsets = np.arange(0, horizon_seconds + 1, coarse_seconds)
+        t_coarse = AstroTime(_wall_clock_jds(coarse_offsets), format="jd", scale="utc")
+        coarse_frame = AltAz(obstime=t_coarse, location=self.location)
+
+        # Interpolated astrometry context: precession/nutation and the
+        # other slowly-varying ERFA terms are computed on a 10-minute
+        # grid and reused across the array transforms below — far
+        # below the 5-minute scan resolution, so no precision loss.
+        with erfa_astrom.set(ErfaAstromInterpolator(600 * u.s)):
+            sun_coarse = np.asarray(get_sun(t_coarse).transform_to(coarse_frame).alt.deg)
+            dark_coarse = sun_coarse < -18
+            if not dark_coarse.any():
+                return ("Not found", "Not found")
+
+            # Expand each dark block by one coarse step on each side so the
+            # fine grid brackets the twilight transitions, then sample every
+            # block at 5-minute resolution in one concatenated array
+            near_dark = dark_coarse | np.r_[dark_coarse[1:], False] | np.r_[False, dark_coarse[:-1]]
+            edges = np.diff(np.r_[False, near_dark, False].astype(np.int8))
+            block_starts = np.flatnonzero(edges == 1)
+            block_ends = np.flatnonzero(edges == -1)  # exclusive coarse index
+
+            fine_offsets = np.concatenate([
+                np.arange(coarse_offsets[a], coarse_offsets[e - 1] + 1, step_seconds)
+                for a, e in zip(block_starts, block_ends)
+            ])
+            t_fine = AstroTime(_wall_clock_jds(fine_offsets), format="jd", scale="utc")
+            fine_frame = AltAz(obstime=t_fine, location=self.location)
+            sun_alt = np.asarray(get_sun(t_fine).transform_to(fine_frame).alt.deg)
+            moon_alt = np.asarray(get_body("moon", t_fine).transform_to(fine_frame).alt.deg)
+
+        # NaN altitudes compare False, matching the old skip-on-failure behavior.
+        # Each block starts and ends on a non-dark coarse sample, so a run of
+        # True never spans the gap between two blocks.
+        ok = (sun_alt < -18) & (moon_alt < 0)
+
+        start_indices = np.flatnonzero(ok)
+        if start_indices.size == 0:
+            return ("Not found", "Not found")
+
+        # The window ends at the first non-dark sample after it; a window
+        # still open at the end of the scan is not reported (as before)
+        start_idx = int(start_indices[0])
+        end_candidates = np.flatnonzero(~ok[start_idx:])
+        if end_candidates.size == 0:
+            return ("Not found", "Not found")
+        end_idx = start_idx + int(end_candidates[0])
+
+        return (
+            self._fmt_time(start_local + datetime.timedelta(seconds=int(fine_offsets[start_idx]))),
+            self._fmt_time(start_local + datetime.timedelta(seconds=int(fine_offsets[end_idx])))
+        )
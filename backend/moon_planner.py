@@ -35,10 +35,13 @@ from zoneinfo import ZoneInfo
 import numpy as np
 import astropy.units as u
 from astropy.time import Time
-from astropy.coordinates import EarthLocation, AltAz, get_sun, get_body
+from astropy.coordinates import AltAz, get_sun, get_body
+from astropy.coordinates.erfa_astrom import erfa_astrom, ErfaAstromInterpolator
 
 from astroplan.moon import moon_illumination
 
+from site_cache import make_location
+
 
 class MoonPlanner:
 
@@ -48,10 +51,7 @@ class MoonPlanner:
         self.longitude = longitude
         self.timezone = ZoneInfo(timezone)
 
-        self.location = EarthLocation(
-            lat=latitude * u.deg,
-            lon=longitude * u.deg
-        )
+        self.location = make_location(round(latitude, 4), round(longitude, 4))
 
     # ============================================================
     # Public API
@@ -60,12 +60,13 @@ class MoonPlanner:
     def next_7_nights(self):
 
         today = datetime.datetime.now(self.timezone).date()
+        dates = [today + datetime.timedelta(days=i) for i in range(7)]
         results = []
 
-        for i in range(7):
-            date = today + datetime.timedelta(days=i)
-            night = self._night_data(date)
+        nights = self._nights_data(dates)
+        scores = self._scores([night["hours_strict"] for night in nights])
 
+        for date, night, score in zip(dates, nights, scores):
             results.append({
                 "date": str(date),
                 "dark_hours": {
@@ -77,7 +78,7 @@ class MoonPlanner:
                     "max_altitude": round(night["moon_max_alt"], 1),
                     "illumination_percent": round(night["illumination"], 1)
                 },
-                "astrophoto_score": self._score(night["hours_strict"])
+                "astrophoto_score": int(score)
             })
 
         return results
@@ -86,84 +87,78 @@ class MoonPlanner:
     # Core computation
     # ============================================================
 
-    def _night_data(self, date):
-        """Compute all 3 darkness modes for one night in a single vectorized pass.
+    def _nights_data(self, dates):
+        """Compute all 3 darkness modes for every night in one batched pass.
 
-        Instead of calling _dark_hours 3 times (3 × 73 individual Astropy calls),
-        we build an array of all time points and let Astropy transform the whole
-        array at once.  That yields 2 vectorized calls (sun + moon) per night
-        instead of 146 individual ones — ~50× fewer coordinate transforms.
+        The per-night grids (18:00 → 06:00 local, 10-minute steps) are
+        concatenated into a single time array so the whole forecast costs
+        2 vectorized Astropy calls (sun + moon) total, instead of 2 per
+        night — the ephemeris and frame setup overhead is paid once.
+        The flat altitude arrays are then sliced back per night.
+        Returns one stats dict per date, in order.
         """
-        start = datetime.datetime.combine(
-            date,
-            datetime.time(18, 0),
-            tzinfo=self.timezone
-        )
-        end = datetime.datetime.combine(
-            date + datetime.timedelta(days=1),
-            datetime.time(6, 0),
-            tzinfo=self.timezone
-        )
-
         step_minutes = 10
         step = datetime.timedelta(minutes=step_minutes)
 
-        # Build array of UTC time points
-        utc_times = []
-        dt = start
-        while dt <= end:
-            utc_times.append(dt.astimezone(datetime.timezone.utc))
-            dt += step
-
-        # Single vectorized Astropy call per celestial body
-        t_arr = Time(utc_times)
+        # Each night spans a fixed 12 h of wall-clock time, so every
+        # per-night grid has the same length and the flat arrays reshape
+        # cleanly to (nights, steps)
+        n_steps = int(datetime.timedelta(hours=12) / step) + 1
+
+        starts = [
+            datetime.datetime.combine(date, datetime.time(18, 0), tzinfo=self.timezone)
+            for date in dates
+        ]
+        # Per-sample timestamp() keeps each UTC instant on its local
+        # wall-clock sample across DST transitions (uniform real-time
+        # offsets from the night's start would drift an hour after a
+        # changeover). Numeric-JD Time construction still skips astropy's
+        # per-element datetime parsing; 2440587.5 is the Unix-epoch JD.
+        start_jds = np.array([s.timestamp() for s in starts]) / 86400.0 + 2440587.5
+        jd_grid = np.array(
+            [(s + i * step).timestamp() for s in starts for i in range(n_steps)]
+        ) / 86400.0 + 2440587.5
+
+        # Single vectorized Astropy call per celestial body across all
+        # nights, with the interpolating astrometry provider so the
+        # slowly-varying ERFA terms are evaluated on a 5-minute grid
+        # instead of per sample
+        t_arr = Time(jd_grid, format="jd", scale="utc")
         frame = AltAz(obstime=t_arr, location=self.location)
-        sun_alts = np.asarray(get_sun(t_arr).transform_to(frame).alt.deg)
-        moon_alts = np.asarray(get_body("moon", t_arr).transform_to(frame).alt.deg)
-
-        # Illumination is constant across the night (computed once)
-        illum_percent = self._moon_illumination(start)
-        moon_max_alt = float(np.max(moon_alts))
-
-        astro_night = sun_alts < -18
-        hours_strict = float(np.sum(astro_night & (moon_alts < 0)) * step_minutes / 60)
-        hours_practical = float(np.sum(astro_night & (moon_alts < 5)) * step_minutes / 60)
-        hours_illumination = (
-            float(np.sum(astro_night) * step_minutes / 60) if illum_percent < 15 else 0.0
-        )
-
-        return {
-            "hours_strict": hours_strict,
-            "hours_practical": hours_practical,
-            "hours_illumination": hours_illumination,
-            "moon_max_alt": moon_max_alt,
-            "illumination": illum_percent,
-        }
-
-    # ============================================================
-    # Moon illumination (official astroplan)
-    # ============================================================
-
-    def _moon_illumination(self, dt_local):
-
-        utc_dt = dt_local.astimezone(datetime.timezone.utc)
-        t = Time(utc_dt)
+        with erfa_astrom.set(ErfaAstromInterpolator(300 * u.s)):
+            sun_alts = np.asarray(get_sun(t_arr).transform_to(frame).alt.deg)
+            moon_alts = np.asarray(get_body("moon", t_arr).transform_to(frame).alt.deg)
+        sun_alts = sun_alts.reshape(len(dates), n_steps)
+        moon_alts = moon_alts.reshape(len(dates), n_steps)
+
+        # Illumination is constant across each night (one array call)
+        t_starts = Time(start_jds, format="jd", scale="utc")
+        illum_percents = np.asarray(moon_illumination(t_starts)) * 100
+
+        nights = []
+        for i in range(len(dates)):
+            astro_night = sun_alts[i] < -18
+            night_moon = moon_alts[i]
+            illum_percent = float(illum_percents[i])
+
+            nights.append({
+                "hours_strict": float(np.sum(astro_night & (night_moon < 0)) * step_minutes / 60),
+                "hours_practical": float(np.sum(astro_night & (night_moon < 5)) * step_minutes / 60),
+                "hours_illumination": (
+                    float(np.sum(astro_night) * step_minutes / 60) if illum_percent < 15 else 0.0
+                ),
+                "moon_max_alt": float(np.max(night_moon)),
+                "illumination": illum_percent,
+            })
 
-        illum = moon_illumination(t) * 100
-        return float(illum)
+        return nights
 
     # ============================================================
     # Simple astrophotography score
     # ============================================================
 
-    def _score(self, strict_hours):
-
-        if strict_hours >= 6:
-            return 100
-        elif strict_hours >= 4:
-            return 80
-        elif strict_hours >= 2:
-            return 60
-        elif strict_hours > 0:
-            return 40
-        return 10
\ No newline at end of file
+    @staticmethod
+    def _scores(strict_hours):
+        """Scores for an array of strict dark-hour totals, one numpy expression"""
+        h = np.asarray(strict_hours)
+        return np.select([h >= 6, h >= 4, h >= 2, h > 0], [100, 80, 60, 40], default=10)
\ No newline at end of file
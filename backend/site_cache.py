@@ -0,0 +1,24 @@
+"""
+Shared per-site EarthLocation cache
+
+Services are instantiated per request, and EarthLocation construction
+goes through astropy's Quantity machinery (~0.2 ms each). The location
+for a given site never changes, so it is built once per rounded
+coordinate pair and shared process-wide. The astronomy-engine Observer
+and ZoneInfo objects the services also hold are sub-microsecond to
+build (ZoneInfo caches internally) and are not worth caching here.
+"""
+
+from functools import lru_cache
+
+import astropy.units as u
+from astropy.coordinates import EarthLocation
+
+
+@lru_cache(maxsize=64)
+def make_location(lat_key: float, lon_key: float) -> EarthLocation:
+    """EarthLocation for rounded coordinates, shared across service instances"""
+    return EarthLocation(
+        lat=lat_key * u.deg,
+        lon=lon_key * u.deg
+    )
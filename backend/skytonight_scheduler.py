@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 import threading
 import time
@@ -85,7 +86,8 @@ def resolve_schedule(config: Dict[str, Any], now: Optional[datetime] = None) ->
     longitude = location.get('longitude')
     if latitude is not None and longitude is not None:
         sun_service = SunService(latitude=latitude, longitude=longitude, timezone=timezone_name)
-        for report in (sun_service.get_today_report(), sun_service.get_tomorrow_report()):
+        # One batched sweep covers both days' twilight times
+        for report in sun_service.get_days_report(2):
             # Post-astronomical-night run: 1 hour after astronomical dawn
             dawn_time = _parse_local_datetime(report.astronomical_dawn, timezone_name)
             if dawn_time is not None:
@@ -148,6 +150,16 @@ class SkyTonightScheduler:
         self._triggered_mode: Optional[str] = None
         self._triggered_reason: Optional[str] = None
         self._execution_lock = threading.Lock()
+        # Serialized form of the last written status (minus server_time)
+        # so _write_status can skip the disk write when nothing changed
+        self._last_status_key: Optional[str] = None
+        # Wakes the run loop out of its 5 s sleep: set by stop() so
+        # shutdown is immediate, and by trigger_now() so a manual run
+        # starts without waiting out the sleep
+        self._wake_event = threading.Event()
+        # Manual run requested via trigger_now(); consumed by the run
+        # loop so triggers never spawn their own execution threads
+        self._manual_trigger_event = threading.Event()
         self._scheduler_started = False
         self.last_execution_duration_seconds: Optional[int] = None
         # Optional event set by CacheScheduler after first successful update.
@@ -223,6 +235,8 @@ class SkyTonightScheduler:
             return
         self._scheduler_started = True
         self.running = True
+        self._wake_event.clear()
+        self._manual_trigger_event.clear()
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
         self.thread.start()
         logger.info('SkyTonight scheduler started')
@@ -230,6 +244,7 @@ class SkyTonightScheduler:
 
     def stop(self):
         self.running = False
+        self._wake_event.set()
         if self.thread:
             self.thread.join(timeout=3)
         logger.info('SkyTonight scheduler stopped')
@@ -283,18 +298,27 @@ class SkyTonightScheduler:
                 self.current_mode = 'disabled'
                 self.current_reason = 'SkyTonight is disabled in configuration.'
                 self._write_status()
-                time.sleep(5)
+                self._sleep_until_wake()
                 continue
 
+            # In-process triggers arrive via the event set by trigger_now();
+            # other worker processes still signal through the trigger file.
+            manual_trigger = self._manual_trigger_event.is_set()
+            if manual_trigger:
+                self._manual_trigger_event.clear()
+
             trigger_file = get_scheduler_trigger_file()
-            manual_trigger = False
-            if os.path.exists(trigger_file):
-                try:
-                    os.remove(trigger_file)
-                    manual_trigger = True
-                    logger.info('SkyTonight manual trigger detected')
-                except Exception as error:
-                    logger.error(f'Failed to remove SkyTonight trigger file: {error}')
+            # One unlink fuses the exists+remove pair: race-free against a
+            # concurrent trigger and a single syscall on the idle path
+            try:
+                os.unlink(trigger_file)
+                manual_trigger = True
+            except FileNotFoundError:
+                pass
+            except Exception as error:
+                logger.error(f'Failed to remove SkyTonight trigger file: {error}')
+            if manual_trigger:
+                logger.info('SkyTonight manual trigger detected')
 
             schedule = resolve_schedule(config)
             self.current_mode = schedule.mode
@@ -378,7 +402,15 @@ class SkyTonightScheduler:
             # Always write status every loop iteration so progress duration
             # stays live in the status file while execution is running.
             self._write_status(schedule=schedule)
-            time.sleep(5)
+            self._sleep_until_wake()
+
+    def _sleep_until_wake(self):
+        """Sleep up to 5 s, returning early when stop() or trigger_now() signals."""
+        self._wake_event.wait(5)
+        if self.running:
+            # Only consume the wake-up while still running; a set left by
+            # stop() must survive so the loop exits on its next check
+            self._wake_event.clear()
 
     def _execute_cycle(self, manual_trigger: bool = False):
         config = self.config_loader()
@@ -434,7 +466,7 @@ class SkyTonightScheduler:
                 self._triggered_reason = None
                 self._write_status()
 
-    def _write_status(self, schedule: Optional[SkyTonightSchedule] = None):
+    def _write_status(self, schedule: Optional[SkyTonightSchedule] = None) -> Dict[str, Any]:
         config = self.config_loader()
         enabled = bool(config.get('skytonight', {}).get('enabled', False))
 
@@ -496,13 +528,30 @@ class SkyTonightScheduler:
                 **calc_progress,
             },
         }
-        save_scheduler_status(payload)
+
+        # The run loop calls this every 5 seconds; while idle the payload
+        # only actually changes when the schedule rolls over. Serialize once
+        # (server_time excluded — it differs on every call) and skip the
+        # disk write when nothing else moved. save_scheduler_status already
+        # writes via a tempfile + os.replace, so writes that do happen are
+        # atomic.
+        status_key = json.dumps(
+            {key: value for key, value in payload.items() if key != 'server_time'},
+            separators=(',', ':'),
+            sort_keys=True,
+            default=str,
+        )
+        if status_key != self._last_status_key:
+            save_scheduler_status(payload)
+            self._last_status_key = status_key
+        return payload
 
     def get_status(self) -> Dict[str, Any]:
         config = self.config_loader()
         schedule = resolve_schedule(config)
-        self._write_status(schedule=schedule)
-        status = load_scheduler_status(default={})
+        # Use the freshly built payload directly instead of round-tripping
+        # through the status file (which is only rewritten on change)
+        status = dict(self._write_status(schedule=schedule))
         status.setdefault('running', self.running)
         status.setdefault('enabled', bool(config.get('skytonight', {}).get('enabled', False)))
         return status
@@ -510,5 +559,12 @@ class SkyTonightScheduler:
     def trigger_now(self) -> Dict[str, Any]:
         if self._execution_lock.locked():
             return {'status': 'skipped', 'reason': 'execution already in progress'}
-        threading.Thread(target=self._execute_cycle, kwargs={'manual_trigger': True}, daemon=True).start()
+        if not self.running:
+            return {'status': 'skipped', 'reason': 'scheduler not running'}
+        # Signal the long-lived run loop instead of spawning a thread per
+        # trigger: the loop wakes immediately and starts the run through
+        # its normal manual path, so repeated triggers cannot pile up
+        # threads while one is blocked on the execution lock.
+        self._manual_trigger_event.set()
+        self._wake_event.set()
         return {'status': 'triggered'}
\ No newline at end of file
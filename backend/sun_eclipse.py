@@ -34,23 +34,52 @@ Example output:
     "duration_minutes": 174,
     "astrophotography_score": 6.5,
     "score_classification": "Moderate interest",
-    "altitude_vs_time": [
-      {"time": "13:05", "altitude": 0.0, "azimuth": 90.0},
-      ...
-    ]
+    "altitude_vs_time": {
+      "times": ["13:05", ...],
+      "altitudes_deg": [0.0, ...],
+      "azimuths_deg": [90.0, ...]
+    }
   }
 }
 """
 
 import datetime
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from typing import Any, Optional, List
 
+import numpy as np
 from astronomy import SearchLocalSolarEclipse, Time as AstronTime, Observer
 from astropy.time import Time as AstroTime
-from astropy.coordinates import EarthLocation, AltAz, get_sun
-import astropy.units as u
+from astropy.coordinates import AltAz, get_sun
+
+from fast_altaz import HAS_FAST_ALTAZ, fast_altaz
+from site_cache import make_location
+
+
+# Score classification bins: lower bounds (exclusive downward) and the
+# name of each bin, resolved with one bisect instead of a branch chain
+_SCORE_CLASS_BOUNDS = (3.0, 5.0, 7.0, 8.5)
+_SCORE_CLASS_NAMES = ("low", "moderate", "good", "very_good", "excellent")
+
+
+@lru_cache(maxsize=256)
+def _next_eclipse_search(lat_q: float, lon_q: float, day_bucket: int) -> Optional[Any]:
+    """Next local solar eclipse searching from the given day's midnight UTC.
+
+    SearchLocalSolarEclipse can scan ~18 months of geometry, yet its
+    answer only changes when an eclipse passes — so one search per site
+    per day is plenty, and the refresher re-scoring the cache every
+    cycle reuses it. Keyed like the alt/az cache: the service is
+    rebuilt per call, so the memo lives at module level. Callers must
+    re-check that the returned eclipse has not already ended.
+    """
+    t_start = AstronTime(
+        datetime.date.fromordinal(day_bucket).strftime("%Y-%m-%dT00:00:00Z")
+    )
+    return SearchLocalSolarEclipse(t_start, Observer(lat_q, lon_q, 0))
 
 
 # =============================
@@ -58,11 +87,23 @@ import astropy.units as u
 # =============================
 
 @dataclass
-class EclipsePoint:
-    """Data point for altitude vs time"""
-    time: str  # "HH:MM" local time
-    altitude_deg: float
-    azimuth_deg: float
+class EclipseCurve:
+    """Structure-of-arrays altitude-vs-time curve.
+
+    Parallel arrays instead of one object per sample — the serialized
+    form names each field once rather than once per point. to_dict()
+    expands to the JSON shape exactly once at the cache boundary.
+    """
+    times: List[str]  # "HH:MM" local time
+    altitudes_deg: np.ndarray
+    azimuths_deg: np.ndarray
+
+    def to_dict(self) -> dict:
+        return {
+            "times": list(self.times),
+            "altitudes_deg": np.round(self.altitudes_deg, 1).tolist(),
+            "azimuths_deg": np.round(self.azimuths_deg, 1).tolist(),
+        }
 
 
 @dataclass
@@ -79,7 +120,7 @@ class SolarEclipseInfo:
     duration_minutes: int
     astrophotography_score: float
     score_classification: str
-    altitude_vs_time: List[EclipsePoint]
+    altitude_vs_time: EclipseCurve
 
 
 # =============================
@@ -95,10 +136,7 @@ class SolarEclipseService:
         self.timezone = ZoneInfo(timezone)
 
         self.observer = Observer(latitude, longitude, 0)
-        self.location = EarthLocation(
-            lat=latitude * u.deg,
-            lon=longitude * u.deg
-        )
+        self.location = make_location(round(latitude, 4), round(longitude, 4))
 
     # =============================
     # Public API
@@ -107,13 +145,25 @@ class SolarEclipseService:
     def get_next_eclipse(self) -> Optional[SolarEclipseInfo]:
         """Get next solar eclipse from now"""
         
-        # astronomy.Time expects UTC time
         now_utc = datetime.datetime.now(datetime.timezone.utc)
-        t_start_str = now_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-        t_start = AstronTime(t_start_str)
 
-        # Search for next eclipse (astronomy-engine returns None if no eclipse in next ~18 months)
-        eclipse = SearchLocalSolarEclipse(t_start, self.observer)
+        # Day-bucketed memoized search (astronomy-engine returns None if
+        # no eclipse in the next ~18 months)
+        eclipse = _next_eclipse_search(
+            round(self.latitude, 3),
+            round(self.longitude, 3),
+            now_utc.date().toordinal()
+        )
+        # Time.Utc() may return a naive datetime depending on the
+        # astronomy-engine version
+        partial_end_utc = eclipse.partial_end.time.Utc() if eclipse is not None else None
+        if partial_end_utc is not None and partial_end_utc.tzinfo is None:
+            partial_end_utc = partial_end_utc.replace(tzinfo=datetime.timezone.utc)
+        if eclipse is not None and now_utc > partial_end_utc:
+            # The day's cached search found an eclipse that has since
+            # ended; search onward from the current instant instead
+            t_start = AstronTime(now_utc.strftime("%Y-%m-%dT%H:%M:%SZ"))
+            eclipse = SearchLocalSolarEclipse(t_start, self.observer)
         if eclipse is None:
             return None
 
@@ -128,10 +178,9 @@ class SolarEclipseService:
         partial_end_utc = eclipse.partial_end.time.Utc()
         partial_end_local = partial_end_utc.astimezone(self.timezone)
 
-        # Calculate altitude/azimuth at peak
+        # Calculate altitude at peak
         peak_alt_deg = eclipse.peak.altitude
         peak_alt_deg = max(peak_alt_deg, 0.0)  # Ensure non-negative for visible eclipses
-        peak_az_deg = self._get_sun_azimuth(peak_utc)
 
         # Determine eclipse type
         eclipse_type = self._get_eclipse_type(eclipse)
@@ -147,8 +196,11 @@ class SolarEclipseService:
         duration_seconds = (partial_end_local - partial_begin_local).total_seconds()
         duration_minutes = int(duration_seconds / 60)
 
-        # Generate altitude vs time points
-        altitude_vs_time = self._generate_altitude_vs_time(partial_begin_local, partial_end_local)
+        # Generate altitude vs time points; the peak instant rides along
+        # in the same transform and yields the peak azimuth
+        altitude_vs_time, peak_az_deg = self._generate_altitude_vs_time(
+            partial_begin_local, partial_end_local, peak_utc
+        )
 
         # Calculate astrophotography score
         score, classification = self._calculate_astrophotography_score(
@@ -187,65 +239,57 @@ class SolarEclipseService:
         else:
             return "Partial"
 
-    def _get_sun_azimuth(self, dt_utc: datetime.datetime) -> float:
-        """Get sun's azimuth at given UTC time"""
-        t_astropy = AstroTime(dt_utc)
-        frame = AltAz(obstime=t_astropy, location=self.location)
-
-        sun = get_sun(t_astropy)
-        sun_transformed = sun.transform_to(frame)
-
-        az = self._coord_attribute(sun_transformed, "az")
-        return az if az is not None else 0.0
-
-    def _coord_attribute(self, coord: Any, attr_name: str) -> Optional[float]:
-        """Safely extract altitude or azimuth from transformed coordinate"""
-        attr = getattr(coord, attr_name, None)
-        if attr is None:
-            return None
-        try:
-            value = attr.to_value(u.deg) if hasattr(attr, "to_value") else float(attr)
-            return float(value)
-        except (AttributeError, TypeError):
-            return None
-
     def _generate_altitude_vs_time(
         self,
         start_local: datetime.datetime,
-        end_local: datetime.datetime
-    ) -> List[EclipsePoint]:
-        """Generate altitude vs time points for the eclipse"""
-        
-        points = []
-        
-        # Generate points every 5 minutes
-        current = start_local
-        step = datetime.timedelta(minutes=5)
+        end_local: datetime.datetime,
+        peak_utc: datetime.datetime
+    ) -> tuple[EclipseCurve, float]:
+        """Generate the altitude-vs-time curve plus the peak azimuth.
+
+        All samples go through one array-valued Time and a single
+        transform instead of a per-step astropy round-trip, which
+        amortizes the astrometry setup over the whole window. The peak
+        instant is appended as one extra sample so its azimuth comes
+        from the same transform instead of a second frame setup. When
+        PyERFA is available the direct ERFA path additionally skips
+        astropy's frame-graph machinery entirely.
+        """
+        # 30 evenly spaced samples across the window, inclusive of both
+        # ends — visually identical to a dense 5-minute stride for the
+        # chart, regardless of the eclipse duration
+        n_steps = 30
+        duration_s = (end_local - start_local).total_seconds()
+        offsets_s = np.linspace(0.0, duration_s, n_steps)
+        local_times = [
+            start_local + datetime.timedelta(seconds=float(s)) for s in offsets_s
+        ]
+        # Numeric-JD Time construction skips astropy's per-element
+        # datetime parsing (2440587.5 is the Unix-epoch JD); each curve
+        # sample takes its own local time's timestamp() so the computed
+        # instants match the HH:MM labels even across a DST changeover.
+        # The peak instant rides along as one extra sample.
+        all_timestamps = np.append(
+            np.array([t.timestamp() for t in local_times]), peak_utc.timestamp()
+        )
+        t_astropy = AstroTime(all_timestamps / 86400.0 + 2440587.5, format="jd", scale="utc")
 
-        while current <= end_local:
-            current_utc = current.astimezone(datetime.timezone.utc)
-            t_astropy = AstroTime(current_utc)
+        sun = get_sun(t_astropy)
+        if HAS_FAST_ALTAZ:
+            alt_arr, az_arr = fast_altaz(sun, t_astropy, self.latitude, self.longitude)
+        else:
             frame = AltAz(obstime=t_astropy, location=self.location)
-
-            sun = get_sun(t_astropy)
             sun_transformed = sun.transform_to(frame)
-
-            alt = self._coord_attribute(sun_transformed, "alt")
-            az = self._coord_attribute(sun_transformed, "az")
-            
-            alt = alt if alt is not None else 0.0
-            az = az if az is not None else 0.0
-
-            time_str = current.strftime("%H:%M")
-            points.append(EclipsePoint(
-                time=time_str,
-                altitude_deg=round(alt, 1),
-                azimuth_deg=round(az, 1)
-            ))
-
-            current += step
-
-        return points
+            alt_arr = np.asarray(sun_transformed.alt.deg)
+            az_arr = np.asarray(sun_transformed.az.deg)
+
+        curve = EclipseCurve(
+            # f-string beats strftime, which redoes the tz lookup per call
+            times=[f"{current.hour:02d}:{current.minute:02d}" for current in local_times],
+            altitudes_deg=np.asarray(alt_arr[:n_steps], dtype=float),
+            azimuths_deg=np.asarray(az_arr[:n_steps], dtype=float)
+        )
+        return curve, float(az_arr[-1])
 
     def _calculate_astrophotography_score(
         self,
@@ -302,17 +346,7 @@ class SolarEclipseService:
         final_score = base_score + altitude_bonus + duration_bonus + magnitude_bonus - altitude_penalty
         final_score = max(0.0, min(10.0, final_score))  # Clamp to 0-10
 
-        # Classification
-        if final_score >= 8.5:
-            classification = "excellent"
-        elif final_score >= 7.0:
-            classification = "very_good"
-        elif final_score >= 5.0:
-            classification = "good"
-        elif final_score >= 3.0:
-            classification = "moderate"
-        else:
-            classification = "low"
+        classification = _SCORE_CLASS_NAMES[bisect_right(_SCORE_CLASS_BOUNDS, final_score)]
 
         return final_score, classification
 
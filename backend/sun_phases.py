@@ -30,12 +30,33 @@ Example output (on API call):
 
 import datetime
 from dataclasses import dataclass
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 import numpy as np
+from astronomy import Body, Equator, Horizon, Observer, Refraction, Time as AstronTime
 from astropy.time import Time as AstroTime
-from astropy.coordinates import EarthLocation, AltAz, get_sun
-import astropy.units as u
+from astropy.coordinates import AltAz, get_sun
+
+from site_cache import make_location
+
+
+@lru_cache(maxsize=4096)
+def _sun_alt_minute(lat_q: float, lon_q: float, minute_epoch: int) -> float:
+    """Sun altitude in degrees at a minute-quantized instant, cached process-wide.
+
+    Computed with astronomy-engine's scalar kernel, which skips
+    astropy's Quantity/frame plumbing entirely (~0.1 ms vs ~20 ms per
+    call) and agrees with the vectorized astropy grid to ~3e-4°.
+    Refraction.Airless keeps it on the same geometric-altitude
+    convention as that grid. The bisection probes land on whole
+    minutes, so the minute key is exact for them.
+    """
+    dt_utc = datetime.datetime.fromtimestamp(minute_epoch * 60, datetime.timezone.utc)
+    t = AstronTime(dt_utc.strftime("%Y-%m-%dT%H:%M:%SZ"))
+    observer = Observer(lat_q, lon_q, 0)
+    eq = Equator(Body.Sun, t, observer, True, True)
+    return Horizon(t, observer, eq.ra, eq.dec, Refraction.Airless).altitude
 
 
 # -----------------------------
@@ -70,10 +91,7 @@ class SunService:
         self.longitude = longitude
         self.timezone = ZoneInfo(timezone)
 
-        self.location = EarthLocation(
-            lat=latitude * u.deg,
-            lon=longitude * u.deg
-        )
+        self.location = make_location(round(latitude, 4), round(longitude, 4))
 
     # -----------------------------
     # Public API
@@ -88,26 +106,78 @@ class SunService:
         tomorrow = datetime.date.today() + datetime.timedelta(days=1)
         return self._compute_day(tomorrow)
 
+    def get_days_report(self, n_days=2):
+        """Reports for today and the following n_days - 1 days.
+
+        The per-day noon → noon coarse grids are concatenated into one
+        time array so the whole span costs a single vectorized
+        transform (the moon planner batches its nights the same way);
+        the altitude rows are then sliced back per day for the
+        crossing search.
+        """
+        today = datetime.date.today()
+        starts = [
+            datetime.datetime.combine(
+                today + datetime.timedelta(days=i), datetime.time(12, 0), self.timezone
+            )
+            for i in range(n_days)
+        ]
+
+        step_minutes = 30
+        n_steps = int(24 * 60 / step_minutes) + 1  # inclusive of both endpoints
+        # Per-sample wall-clock timestamps keep the grid aligned with the
+        # reported local crossing times across DST changeovers (uniform
+        # real-time offsets would drift an hour after the transition)
+        jd_grid = np.array([
+            (start + datetime.timedelta(minutes=i * step_minutes)).timestamp()
+            for start in starts
+            for i in range(n_steps)
+        ]) / 86400.0 + 2440587.5
+
+        t_arr = AstroTime(jd_grid, format="jd", scale="utc")
+        frame = AltAz(obstime=t_arr, location=self.location)
+        all_alts = np.asarray(get_sun(t_arr).transform_to(frame).alt.deg)
+        all_alts = all_alts.reshape(n_days, n_steps)
+
+        return [
+            self._report_from_alts(start, alts, step_minutes)
+            for start, alts in zip(starts, all_alts)
+        ]
+
     # -----------------------------
     # Core calculation
     # -----------------------------
 
     def _compute_day(self, date):
 
-        # Build a single array covering noon → next noon (5-min steps)
-        # and run one vectorized Astropy call instead of 2304 individual ones.
-        step_minutes = 5
+        # Coarse 30-minute grid covering noon → next noon, computed with
+        # one vectorized Astropy call. The sun crosses each twilight
+        # altitude at most twice a day and spends hours between
+        # crossings, so the coarse grid brackets every crossing; a short
+        # scalar bisection then refines each bracket to the minute —
+        # finer output than the old dense 5-minute scan for a sixth of
+        # the samples.
+        step_minutes = 30
         start = datetime.datetime.combine(date, datetime.time(12, 0), self.timezone)
         n_steps = int(24 * 60 / step_minutes) + 1  # inclusive of both endpoints
 
-        utc_times = [
-            (start + datetime.timedelta(minutes=i * step_minutes)).astimezone(datetime.timezone.utc)
+        # Numeric-JD Time construction skips astropy's per-element
+        # datetime parsing (2440587.5 is the Unix-epoch JD); each sample
+        # takes its own wall-clock time's timestamp() so the grid stays
+        # aligned with the reported local crossing times across DST
+        jd_grid = np.array([
+            (start + datetime.timedelta(minutes=i * step_minutes)).timestamp()
             for i in range(n_steps)
-        ]
-        t_arr = AstroTime(utc_times)
+        ]) / 86400.0 + 2440587.5
+        t_arr = AstroTime(jd_grid, format="jd", scale="utc")
         frame = AltAz(obstime=t_arr, location=self.location)
         sun_alts = np.asarray(get_sun(t_arr).transform_to(frame).alt.deg)
 
+        return self._report_from_alts(start, sun_alts, step_minutes)
+
+    def _report_from_alts(self, start, sun_alts, step_minutes):
+        """Crossing search + report for one day's coarse altitude array"""
+
         def find_crossing(target_alt, direction):
             if direction == "down":
                 mask = (sun_alts[:-1] > target_alt) & (sun_alts[1:] <= target_alt)
@@ -116,7 +186,10 @@ class SunService:
             indices = np.nonzero(mask)[0]
             if len(indices) == 0:
                 return None
-            return start + datetime.timedelta(minutes=(int(indices[0]) + 1) * step_minutes)
+            idx = int(indices[0])
+            lo = start + datetime.timedelta(minutes=idx * step_minutes)
+            hi = lo + datetime.timedelta(minutes=step_minutes)
+            return self._bisect_crossing(lo, hi, target_alt, direction)
 
         sunset    = find_crossing(0,   "down")
         sunrise   = find_crossing(0,   "up")
@@ -143,12 +216,34 @@ class SunService:
             true_night_hours=round(night_hours, 2)
         )
 
+    def _bisect_crossing(self, lo, hi, target_alt, direction):
+        """Narrow a bracketed altitude crossing down to one minute.
+
+        lo is on the pre-crossing side and hi at or past the threshold;
+        each scalar altitude evaluation halves the bracket, so a 30-min
+        bracket resolves in 5 steps. Midpoints stay on whole minutes so
+        the result is the first whole minute at or past the threshold,
+        matching the grid-scan convention.
+        """
+        lo_m, hi_m = 0, round((hi - lo).total_seconds() / 60)
+        while hi_m - lo_m > 1:
+            mid_m = (lo_m + hi_m) // 2
+            alt = self._sun_altitude(lo + datetime.timedelta(minutes=mid_m))
+            still_before = alt > target_alt if direction == "down" else alt < target_alt
+            if still_before:
+                lo_m = mid_m
+            else:
+                hi_m = mid_m
+        return lo + datetime.timedelta(minutes=hi_m)
+
     def _sun_altitude(self, dt_local):
         """Return sun altitude in degrees at a single local datetime (used by tests)."""
-        utc = dt_local.astimezone(datetime.timezone.utc)
-        t = AstroTime(utc)
-        frame = AltAz(obstime=t, location=self.location)
-        return float(get_sun(t).transform_to(frame).alt.deg)
+        # timestamp() is tz-aware already — no astimezone round-trip needed
+        return _sun_alt_minute(
+            round(self.latitude, 3),
+            round(self.longitude, 3),
+            int(round(dt_local.timestamp() / 60))
+        )
 
     # -----------------------------
     # Formatting
@@ -1,13 +1,19 @@
 """Load repository metadata from text files."""
 import os
+from functools import lru_cache
 from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+@lru_cache(maxsize=1)
 def get_repo_version():
     """
     Load the repository version from VERSION file
-    
+
+    The VERSION file only changes at deploy time, so the parsed value
+    is cached for the process lifetime instead of re-reading the file
+    on every request.
+
     Returns:
         str: Repository version string (e.g., "v0.9.0")
     """
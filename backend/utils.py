@@ -74,11 +74,14 @@ class IndentDumper(yaml.Dumper):
 def ensure_directory_exists(path: str) -> None:
     """
     Ensure a directory exists, creating it if necessary
-    
+
     Args:
         path: Directory path to create
     """
-    os.makedirs(path, exist_ok=True)
+    # One stat in the common already-exists case instead of makedirs
+    # walking the path with a mkdir attempt per component
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
 
 
 def slugify_location_name(value: str, fallback: str = 'default-location') -> str:
@@ -158,16 +161,18 @@ def save_json_file(file_path: str, data: dict) -> bool:
 
 
 # Coordinate conversion utilities
-DMS_PATTERN = re.compile(r"([+-]?\d+)[d°]\s*(\d+)[m']\s*([\d.]+)[s\"]?")
+# re.ASCII: inputs are ASCII-normalized before matching, so \d and \s
+# can skip the Unicode property tables
+DMS_PATTERN = re.compile(r"([+-]?\d+)[d°]\s*(\d+)[m']\s*([\d.]+)[s\"]?", re.ASCII)
 
 
 def dms_to_decimal(dms_string: str) -> Optional[float]:
     """
     Convert DMS (Degrees Minutes Seconds) string to decimal degrees
-    
+
     Args:
         dms_string: DMS string like "48d38m36.16s" or "48°38'36.16\""
-        
+
     Returns:
         Decimal degrees or None if conversion fails
     """
@@ -175,11 +180,11 @@ def dms_to_decimal(dms_string: str) -> Optional[float]:
         match = DMS_PATTERN.match(dms_string.strip())
         if not match:
             return None
-            
+
         degrees = float(match.group(1))
         minutes = float(match.group(2))
         seconds = float(match.group(3))
-        
+
         # Handle negative degrees
         if degrees < 0:
             return degrees - (minutes / 60.0) - (seconds / 3600.0)
@@ -224,22 +229,25 @@ def validate_coordinates(lat: float, lon: float) -> bool:
         return False
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_file_size(size_bytes: float) -> str:
     """
     Format file size in human-readable format
-    
+
     Args:
         size_bytes: Size in bytes
-        
+
     Returns:
         Formatted string like "1.5 MB"
     """
-    size = float(size_bytes)
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} TB"
+    # bit_length picks the 1024-power unit directly instead of looping
+    # with repeated float division; sizes below 1 (and negatives) clamp
+    # to the byte unit
+    n = max(int(size_bytes), 1)
+    index = min((n.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
 
 
 def get_environment_info() -> Dict[str, str]:
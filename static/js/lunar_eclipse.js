@@ -169,14 +169,14 @@ async function loadLunarEclipse() {
 
         container.appendChild(row);
 
-        if (eclipse.altitude_vs_time && eclipse.altitude_vs_time.length > 0) {
+        if (eclipse.altitude_vs_time && eclipse.altitude_vs_time.times && eclipse.altitude_vs_time.times.length > 0) {
             const chartContainer = document.createElement('div');
             chartContainer.id = 'lunar-eclipse-chart-container';
             container.appendChild(chartContainer);
         }
 
         // Create altitude vs time chart if data available
-        if (eclipse.altitude_vs_time && eclipse.altitude_vs_time.length > 0) {
+        if (eclipse.altitude_vs_time && eclipse.altitude_vs_time.times && eclipse.altitude_vs_time.times.length > 0) {
             renderLunarEclipseAltitudeChart(eclipse.altitude_vs_time);
         }
 
@@ -194,12 +194,12 @@ async function loadLunarEclipse() {
 // Render altitude vs time chart
 function renderLunarEclipseAltitudeChart(altitudeData) {
     const container = document.getElementById('lunar-eclipse-chart-container');
-    if (!container || !altitudeData || altitudeData.length === 0) return;
+    if (!container || !altitudeData || !altitudeData.times || altitudeData.times.length === 0) return;
 
     destroyLunarEclipseChart();
 
-    const times = altitudeData.map(p => p.time);
-    const altitudes = altitudeData.map(p => p.altitude_deg);
+    const times = altitudeData.times;
+    const altitudes = altitudeData.altitudes_deg;
 
     DOMUtils.clear(container);
     const col = document.createElement('div');
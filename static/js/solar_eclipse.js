@@ -162,14 +162,14 @@ async function loadSolarEclipse() {
 
         container.appendChild(row);
 
-        if (eclipse.altitude_vs_time && eclipse.altitude_vs_time.length > 0) {
+        if (eclipse.altitude_vs_time && eclipse.altitude_vs_time.times && eclipse.altitude_vs_time.times.length > 0) {
             const chartContainer = document.createElement('div');
             chartContainer.id = 'solar-eclipse-chart-container';
             container.appendChild(chartContainer);
         }
 
         // Create altitude vs time chart if data available
-        if (eclipse.altitude_vs_time && eclipse.altitude_vs_time.length > 0) {
+        if (eclipse.altitude_vs_time && eclipse.altitude_vs_time.times && eclipse.altitude_vs_time.times.length > 0) {
             renderSolarEclipseAltitudeChart(eclipse.altitude_vs_time);
         }
 
@@ -187,12 +187,12 @@ async function loadSolarEclipse() {
 // Render altitude vs time chart
 function renderSolarEclipseAltitudeChart(altitudeData) {
     const container = document.getElementById('solar-eclipse-chart-container');
-    if (!container || !altitudeData || altitudeData.length === 0) return;
+    if (!container || !altitudeData || !altitudeData.times || altitudeData.times.length === 0) return;
 
     destroySolarEclipseChart();
 
-    const times = altitudeData.map(p => p.time);
-    const altitudes = altitudeData.map(p => p.altitude_deg);
+    const times = altitudeData.times;
+    const altitudes = altitudeData.altitudes_deg;
 
     DOMUtils.clear(container);
     const col = document.createElement('div');
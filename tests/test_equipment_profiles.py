@@ -5,6 +5,7 @@ import pytest
 import os
 import json
 import tempfile
+import time
 from datetime import datetime
 import sys
 
@@ -437,3 +438,266 @@ def test_safe_save_creates_backup(temp_data_dir, test_user_id):
     # Backup should be cleaned up after successful save
     backup_path = file_path + '.backup'
     assert not os.path.exists(backup_path)
+
+
+# ============================================================
+# Write-Behind Tests
+# ============================================================
+
+_SCOPE_PAYLOAD = {
+    'name': 'Deferred Scope',
+    'telescope_type': 'Refractor',
+    'aperture_mm': 80,
+    'focal_length_mm': 400,
+    'reducer_barlow_factor': 1.0
+}
+
+
+@pytest.fixture
+def write_behind(monkeypatch):
+    """Enable write-behind mode and guarantee nothing stays queued afterwards"""
+    monkeypatch.setattr(equipment_profiles, 'WRITE_BEHIND_ENABLED', True)
+    yield
+    equipment_profiles._flush_all()
+
+
+def _wait_for(condition, timeout=2.0):
+    """Poll until the debounce timer's flush satisfies the condition"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return
+        time.sleep(0.02)
+    pytest.fail(f"write-behind flush did not happen within {timeout}s")
+
+
+def test_write_behind_coalesces_burst_into_one_write(temp_data_dir, test_user_id,
+                                                     write_behind, monkeypatch):
+    """A burst of mutations inside the debounce window costs one disk write"""
+    writes = []
+    real_write = equipment_profiles._write_equipment_file
+
+    def counting_write(path, data):
+        # Record after the write so pollers only see completed flushes
+        result = real_write(path, data)
+        writes.append(path)
+        return result
+
+    monkeypatch.setattr(equipment_profiles, '_write_equipment_file', counting_write)
+
+    for i in range(3):
+        created = equipment_profiles.create_telescope(
+            test_user_id, dict(_SCOPE_PAYLOAD, name=f'Scope {i}')
+        )
+        assert created is not None
+
+    file_path = equipment_profiles.get_user_equipment_file(test_user_id)
+    _wait_for(lambda: len(writes) > 0)
+
+    assert writes == [file_path]  # three creates, one flush
+    with open(file_path, 'r', encoding='utf-8') as f:
+        blob = json.load(f)
+    assert len(blob['telescopes']['items']) == 3
+
+
+def test_write_behind_read_your_writes(temp_data_dir, test_user_id, write_behind):
+    """Loads see a queued payload before it reaches the disk"""
+    created = equipment_profiles.create_telescope(test_user_id, _SCOPE_PAYLOAD)
+    file_path = equipment_profiles.get_user_equipment_file(test_user_id)
+
+    # Still queued: disk is untouched, yet the item is readable
+    assert file_path in equipment_profiles._dirty
+    assert not os.path.exists(file_path)
+    fetched = equipment_profiles.get_telescope(test_user_id, created['id'])
+    assert fetched is not None
+    assert fetched['name'] == 'Deferred Scope'
+
+
+def test_write_behind_explicit_flush(temp_data_dir, test_user_id, write_behind):
+    """_flush_all (the atexit hook) persists queued payloads immediately"""
+    created = equipment_profiles.create_telescope(test_user_id, _SCOPE_PAYLOAD)
+    file_path = equipment_profiles.get_user_equipment_file(test_user_id)
+    assert file_path in equipment_profiles._dirty
+
+    equipment_profiles._flush_all()
+
+    assert equipment_profiles._dirty == {}
+    with open(file_path, 'r', encoding='utf-8') as f:
+        blob = json.load(f)
+    assert [item['id'] for item in blob['telescopes']['items']] == [created['id']]
+
+
+# ============================================================
+# Bulk Create Tests
+# ============================================================
+
+def test_create_bulk_persists_all_items(temp_data_dir, test_user_id):
+    """create_bulk stores every payload with a single save"""
+    payloads = [dict(_SCOPE_PAYLOAD, name=f'Bulk {i}') for i in range(3)]
+
+    created = equipment_profiles.create_telescopes_bulk(test_user_id, payloads)
+
+    assert created is not None
+    assert [item['name'] for item in created] == ['Bulk 0', 'Bulk 1', 'Bulk 2']
+    stored = equipment_profiles.load_user_telescopes(test_user_id)
+    assert len(stored['items']) == 3
+
+
+def test_create_bulk_is_all_or_nothing(temp_data_dir, test_user_id):
+    """One invalid payload rejects the whole batch without persisting anything"""
+    payloads = [
+        dict(_SCOPE_PAYLOAD, name='Valid'),
+        {'name': 'Missing everything else'},
+    ]
+
+    created = equipment_profiles.create_telescopes_bulk(test_user_id, payloads)
+
+    assert created is None
+    stored = equipment_profiles.load_user_telescopes(test_user_id)
+    assert stored['items'] == []
+
+
+# ============================================================
+# Legacy Migration Tests
+# ============================================================
+
+def _write_legacy_file(user_id, kind, items):
+    """Create a pre-migration per-kind equipment file on disk"""
+    os.makedirs(equipment_profiles.EQUIPMENT_DIR, exist_ok=True)
+    path = equipment_profiles._legacy_equipment_file(user_id, kind)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'created_at': '2024-01-01T00:00:00', 'items': items}, f)
+    return path
+
+
+def test_migrate_legacy_files_into_combined_blob(temp_data_dir, test_user_id):
+    """Legacy per-kind files are folded into the combined document on first load"""
+    _write_legacy_file(test_user_id, 'telescopes', [{'id': 'legacy-scope', 'name': 'Old Scope'}])
+    _write_legacy_file(test_user_id, 'cameras', [{'id': 'legacy-cam', 'name': 'Old Camera'}])
+
+    telescopes = equipment_profiles.load_user_telescopes(test_user_id)
+
+    assert [item['id'] for item in telescopes['items']] == ['legacy-scope']
+
+    # The combined file now holds every migrated kind
+    combined_path = equipment_profiles.get_user_equipment_file(test_user_id)
+    with open(combined_path, 'r', encoding='utf-8') as f:
+        blob = json.load(f)
+    assert blob['telescopes']['items'][0]['name'] == 'Old Scope'
+    assert blob['cameras']['items'][0]['name'] == 'Old Camera'
+    # Kinds without a legacy file come out empty, not missing
+    assert blob['mounts']['items'] == []
+
+
+def test_migrate_archives_legacy_files(temp_data_dir, test_user_id):
+    """Migrated legacy files are renamed to .legacy so migration never reruns"""
+    legacy_path = _write_legacy_file(
+        test_user_id, 'telescopes', [{'id': 'legacy-scope', 'name': 'Old Scope'}]
+    )
+
+    equipment_profiles.load_user_telescopes(test_user_id)
+
+    assert not os.path.exists(legacy_path)
+    archived = legacy_path + '.legacy'
+    assert os.path.exists(archived)
+    with open(archived, 'r', encoding='utf-8') as f:
+        assert json.load(f)['items'][0]['id'] == 'legacy-scope'
+
+
+def test_legacy_files_ignored_when_combined_exists(temp_data_dir, test_user_id):
+    """An existing combined file wins; stale legacy files are left untouched"""
+    created = equipment_profiles.create_telescope(test_user_id, {
+        'name': 'Current Scope',
+        'telescope_type': 'Refractor',
+        'aperture_mm': 80,
+        'focal_length_mm': 400,
+        'reducer_barlow_factor': 1.0
+    })
+    legacy_path = _write_legacy_file(
+        test_user_id, 'telescopes', [{'id': 'legacy-scope', 'name': 'Old Scope'}]
+    )
+
+    telescopes = equipment_profiles.load_user_telescopes(test_user_id)
+
+    assert [item['id'] for item in telescopes['items']] == [created['id']]
+    # No migration ran: the legacy file is still in place, unarchived
+    assert os.path.exists(legacy_path)
+    assert not os.path.exists(legacy_path + '.legacy')
+
+
+def test_validate_accepts_trailing_whitespace(temp_data_dir, test_user_id):
+    """Valid JSON followed by blank lines must not trip the suffix fast-fail"""
+    created = equipment_profiles.create_telescope(test_user_id, {
+        'name': 'Padded Scope',
+        'telescope_type': 'Refractor',
+        'aperture_mm': 80,
+        'focal_length_mm': 400,
+        'reducer_barlow_factor': 1.0
+    })
+    assert created is not None
+    file_path = equipment_profiles.get_user_equipment_file(test_user_id)
+
+    # Hand-edited files commonly pick up trailing blank lines
+    with open(file_path, 'a', encoding='utf-8') as f:
+        f.write('\n' * 20)
+
+    is_valid, error = equipment_profiles.validate_equipment_json(file_path)
+    assert is_valid, error
+
+    # Truncated files must still fast-fail
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read().rstrip()
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content[:-1] + '\n' * 20)
+    is_valid, _ = equipment_profiles.validate_equipment_json(file_path)
+    assert not is_valid
+
+
+def test_loaded_data_is_isolated_from_cache(temp_data_dir, test_user_id):
+    """Loads return independent copies — mutating one must not leak into
+    the parse cache or other readers"""
+    created = equipment_profiles.create_telescope(test_user_id, {
+        'name': 'Cached Scope',
+        'telescope_type': 'Refractor',
+        'aperture_mm': 80,
+        'focal_length_mm': 400,
+        'reducer_barlow_factor': 1.0
+    })
+
+    data = equipment_profiles.load_user_telescopes(test_user_id)
+    data['items'].clear()
+
+    reloaded = equipment_profiles.load_user_telescopes(test_user_id)
+    assert [item['id'] for item in reloaded['items']] == [created['id']]
+
+
+def test_save_not_skipped_after_external_write(temp_data_dir, test_user_id):
+    """A save matching this process's last write must still hit disk when
+    another process has modified the file in between"""
+    created = equipment_profiles.create_telescope(test_user_id, {
+        'name': 'Mine',
+        'telescope_type': 'Refractor',
+        'aperture_mm': 80,
+        'focal_length_mm': 400,
+        'reducer_barlow_factor': 1.0
+    })
+    file_path = equipment_profiles.get_user_equipment_file(test_user_id)
+
+    # Simulate a second gunicorn worker appending an item directly on disk
+    with open(file_path, 'r', encoding='utf-8') as f:
+        blob = json.load(f)
+    foreign = dict(blob['telescopes']['items'][0])
+    foreign['id'] = 'foreign-item'
+    blob['telescopes']['items'].append(foreign)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(blob, f)
+
+    # Deleting the foreign item leaves content identical to this process's
+    # last write — the skip must notice the file changed underneath and
+    # write anyway, or the delete is silently lost
+    assert equipment_profiles.delete_telescope(test_user_id, 'foreign-item') is True
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        on_disk = json.load(f)
+    ids = [item['id'] for item in on_disk['telescopes']['items']]
+    assert ids == [created['id']]
@@ -0,0 +1,71 @@
+"""Unit tests for the direct-ERFA AltAz transform (fast_altaz.py).
+
+The services use fast_altaz as a drop-in for transform_to(AltAz), so
+these tests compare both paths on the real sun and moon ephemerides and
+require agreement within an arcminute — far inside the 0.1° rounding of
+every consumer.
+"""
+
+import datetime
+
+import numpy as np
+import pytest
+from astropy.coordinates import AltAz, get_body, get_sun
+from astropy.time import Time
+
+from fast_altaz import HAS_FAST_ALTAZ, fast_altaz
+from site_cache import make_location
+
+pytestmark = pytest.mark.skipif(not HAS_FAST_ALTAZ, reason="pyerfa not available")
+
+ARCMIN_DEG = 1.0 / 60.0
+
+LAT = 45.5
+LON = -73.6
+
+
+def _hourly_grid(n_hours=25):
+    base = datetime.datetime(2026, 3, 15, 0, 0, tzinfo=datetime.timezone.utc)
+    grid = np.datetime64(base.replace(tzinfo=None)) + np.arange(n_hours).astype('timedelta64[h]')
+    return Time(grid)
+
+
+def _az_diff_deg(a, b):
+    """Smallest absolute azimuth separation, handling the 360° wrap"""
+    d = np.abs(np.asarray(a) - np.asarray(b)) % 360.0
+    return np.minimum(d, 360.0 - d)
+
+
+def _assert_matches_astropy(coord, t):
+    location = make_location(LAT, LON)
+    frame = AltAz(obstime=t, location=location)
+    expected = coord.transform_to(frame)
+
+    alt, az = fast_altaz(coord, t, LAT, LON)
+
+    assert np.max(np.abs(alt - expected.alt.deg)) < ARCMIN_DEG
+    # Azimuth degenerates near the zenith/nadir, so compare it scaled by
+    # cos(alt) — the on-sky separation the chart actually renders
+    az_err = _az_diff_deg(az, expected.az.deg) * np.cos(np.radians(expected.alt.deg))
+    assert np.max(az_err) < ARCMIN_DEG
+
+
+def test_sun_matches_astropy_over_a_day():
+    t = _hourly_grid()
+    _assert_matches_astropy(get_sun(t), t)
+
+
+def test_moon_matches_astropy_over_a_day():
+    # Geocentric moon carries a distance, so this also exercises the
+    # topocentric parallax branch
+    t = _hourly_grid()
+    _assert_matches_astropy(get_body("moon", t), t)
+
+
+def test_scalar_input_returns_scalar_arrays():
+    t = Time("2026-03-15T18:00:00")
+    alt, az = fast_altaz(get_sun(t), t, LAT, LON)
+    assert np.shape(alt) == ()
+    assert np.shape(az) == ()
+    assert -90.0 <= float(alt) <= 90.0
+    assert 0.0 <= float(az) % 360.0 < 360.0
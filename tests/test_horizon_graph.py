@@ -2,6 +2,9 @@
 
 import datetime
 
+import numpy as np
+import pytest
+
 import horizon_graph as module
 
 
@@ -22,50 +25,33 @@ class FakeCoord:
         return self
 
 
-def test_coord_attribute_with_to_value_and_float_paths():
-    svc = module.HorizonGraphService(45.0, -73.0, "UTC")
-
-    coord = type("Coord", (), {"alt": FakeAngle(12.34), "az": 56.78})()
-    assert svc._coord_attribute(coord, "alt") == 12.34
-    assert svc._coord_attribute(coord, "az") == 56.78
-
-
-def test_coord_attribute_returns_none_for_missing_or_bad_values():
-    svc = module.HorizonGraphService(45.0, -73.0, "UTC")
-
-    class BadAngle:
-        def to_value(self, _unit):
-            raise TypeError("bad")
-
-    coord = type("Coord", (), {"alt": BadAngle()})()
-    assert svc._coord_attribute(coord, "missing") is None
-    assert svc._coord_attribute(coord, "alt") is None
+def _fake_day_frame(date):
+    """Stand-in for module._day_frame: 25 local timestamps plus dummy astropy objects"""
+    local_times = tuple(
+        datetime.datetime.combine(
+            date + datetime.timedelta(days=1) if hour == 24 else date,
+            datetime.time(hour % 24, 0, 0),
+            tzinfo=datetime.timezone.utc,
+        )
+        for hour in range(25)
+    )
+    return local_times, object(), object()
 
 
-def test_generate_body_positions_sun_and_moon(monkeypatch):
+def test_body_angles_sun_and_moon(monkeypatch):
     svc = module.HorizonGraphService(45.0, -73.0, "UTC")
 
-    monkeypatch.setattr(module, "AstroTime", lambda dt: dt)
-    monkeypatch.setattr(module, "AltAz", lambda **_kwargs: object())
+    monkeypatch.setattr(module, "HAS_FAST_ALTAZ", False)
     monkeypatch.setattr(module, "get_sun", lambda _t: FakeCoord(alt=1.23, az=45.67))
-    monkeypatch.setattr(module, "get_body", lambda _name, _t, _loc: FakeCoord(alt=2.34, az=67.89))
-
-    date = datetime.date(2026, 3, 11)
-    sun_points = svc._generate_body_positions(date, "sun")
-    moon_points = svc._generate_body_positions(date, "moon")
+    monkeypatch.setattr(module, "get_body", lambda _name, _t, _loc=None: FakeCoord(alt=2.34, az=67.89))
 
-    assert len(sun_points) == 25
-    assert len(moon_points) == 25
-    assert sun_points[0].time == "00:00"
-    assert sun_points[-1].time == "24:00"
-    assert sun_points[0].altitude_deg == 1.2
-    assert moon_points[0].azimuth_deg == 67.9
+    sun_alt, sun_az = svc._body_angles("sun", object(), object(), 25)
+    moon_alt, moon_az = svc._body_angles("moon", object(), object(), 25)
 
-
-def test_generate_body_positions_unknown_body_returns_empty():
-    svc = module.HorizonGraphService(45.0, -73.0, "UTC")
-    points = svc._generate_body_positions(datetime.date(2026, 3, 11), "planetx")
-    assert points == []
+    assert sun_alt.shape == (25,)
+    assert moon_az.shape == (25,)
+    assert sun_alt[0] == 1.23
+    assert moon_az[-1] == 67.89
 
 
 def test_get_horizon_data_uses_local_date(monkeypatch):
@@ -79,10 +65,59 @@ def test_get_horizon_data_uses_local_date(monkeypatch):
             return fixed_now.astimezone(tz) if tz else fixed_now
 
     monkeypatch.setattr(module.datetime, "datetime", FakeDateTime)
-    monkeypatch.setattr(svc, "_generate_body_positions", lambda _date, body: [body])
+    monkeypatch.setattr(
+        module, "_day_frame",
+        lambda date_iso, _lat, _lon, _tz: _fake_day_frame(datetime.date.fromisoformat(date_iso)),
+    )
+    monkeypatch.setattr(module, "HAS_FAST_ALTAZ", False)
+    monkeypatch.setattr(module, "get_sun", lambda _t: FakeCoord(alt=1.23, az=45.67))
+    monkeypatch.setattr(module, "get_body", lambda _name, _t, _loc=None: FakeCoord(alt=2.34, az=67.89))
 
     data = svc.get_horizon_data()
 
     assert data.date == "2026-03-11"
-    assert data.sun_data == ["sun"]
-    assert data.moon_data == ["moon"]
+    assert len(data.times) == 25
+    assert data.times[0] == "00:00"
+    assert data.times[-1] == "24:00"
+    assert data.sun_alt.shape == (25,)
+
+
+def test_to_dict_expands_response_shape(monkeypatch):
+    svc = module.HorizonGraphService(45.0, -73.0, "UTC")
+
+    monkeypatch.setattr(
+        module, "_day_frame",
+        lambda date_iso, _lat, _lon, _tz: _fake_day_frame(datetime.date.fromisoformat(date_iso)),
+    )
+    monkeypatch.setattr(module, "HAS_FAST_ALTAZ", False)
+    monkeypatch.setattr(module, "get_sun", lambda _t: FakeCoord(alt=1.23, az=45.67))
+    monkeypatch.setattr(module, "get_body", lambda _name, _t, _loc=None: FakeCoord(alt=2.34, az=67.89))
+
+    result = svc.get_horizon_data().to_dict()
+
+    assert len(result["sun_data"]) == 25
+    assert len(result["moon_data"]) == 25
+    assert result["sun_data"][0] == {
+        "hour": 0,
+        "time": "00:00",
+        "altitude_deg": 1.2,
+        "azimuth_deg": 45.7,
+    }
+    assert result["sun_data"][-1]["time"] == "24:00"
+    assert result["moon_data"][0]["azimuth_deg"] == 67.9
+
+
+@pytest.mark.skipif(not module.HAS_FAST_ALTAZ, reason="pyerfa not available")
+def test_fast_path_matches_astropy_fallback(monkeypatch):
+    """The production ERFA path and the transform_to fallback must agree"""
+    svc = module.HorizonGraphService(45.0, -73.0, "UTC")
+
+    fast = svc.get_horizon_data()  # HAS_FAST_ALTAZ left enabled
+    monkeypatch.setattr(module, "HAS_FAST_ALTAZ", False)
+    fallback = svc.get_horizon_data()
+
+    for attr in ("sun_alt", "moon_alt"):
+        assert np.max(np.abs(getattr(fast, attr) - getattr(fallback, attr))) < 0.02
+    for attr in ("sun_az", "moon_az"):
+        az_diff = np.abs(getattr(fast, attr) - getattr(fallback, attr)) % 360.0
+        assert np.max(np.minimum(az_diff, 360.0 - az_diff)) < 0.02
@@ -9,6 +9,11 @@ from txtconf_loader import get_repo_version
 class TestGetRepoVersion:
     """Tests for get_repo_version."""
 
+    def setup_method(self):
+        # The version is cached for the process lifetime; clear it so
+        # each test's mocked file content is actually read
+        get_repo_version.cache_clear()
+
     def test_returns_string(self):
         assert isinstance(get_repo_version(), str)
 